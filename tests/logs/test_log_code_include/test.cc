@@ -0,0 +1 @@
+Not that big
\ No newline at end of file
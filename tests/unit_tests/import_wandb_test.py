@@ -1,6 +1,8 @@
-import pytest
+import subprocess
 import sys
 
+import pytest
+
 
 def test_path_is_unchanged():
     # Ideally we would compare directly to the user's starting path,
@@ -10,3 +12,47 @@ def test_path_is_unchanged():
 
     for item in sys.path:
         assert "wandb/vendor" not in item
+
+
+def _import_times(code="import wandb"):
+    """Run `code` in a fresh interpreter and return cumulative import times (us) by module."""
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        stderr=subprocess.PIPE,
+        check=True,
+        universal_newlines=True,
+    ).stderr
+    times = {}
+    for line in out.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="-X importtime needs py3.7")
+def test_import_defers_heavy_modules():
+    times = _import_times()
+    assert "wandb" in times
+    for name in (
+        "IPython",
+        "distutils",
+        "wandb.wandb_torch",
+        "wandb.plot",
+        "wandb.plots",
+        "wandb.sdk.internal.profiler",
+        "wandb.sdk.internal.internal",
+    ):
+        assert name not in times, f"{name} imported by `import wandb`"
+
+
+def test_lazy_modules_load_on_use():
+    # LazyLoader imports through importlib, which -X importtime doesn't report
+    code = (
+        "import sys, wandb; wandb.plot.line; wandb.wandb_torch.TorchHistory; "
+        "print('wandb.plot' in sys.modules, 'wandb.wandb_torch' in sys.modules)"
+    )
+    out = subprocess.check_output([sys.executable, "-c", code], universal_newlines=True)
+    assert out.split() == ["True", "True"]
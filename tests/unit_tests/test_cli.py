@@ -957,6 +957,27 @@ def test_sync_wandb_run(runner, live_mock_server):
         assert "wandb: ERROR Nothing to sync." in result.output
 
 
+def test_sync_wandb_run_jobs(runner, live_mock_server):
+    with runner.isolated_filesystem():
+        run_dir = os.path.join("wandb", "offline-run-20210216_154407-g9dvvkua")
+        utils.fixture_copy("wandb")
+        utils.fixture_copy(run_dir, run_dir.replace("154407", "154408"))
+
+        result = runner.invoke(cli.sync, ["--sync-all", "--jobs", "2"])
+        print(result.output)
+        print(traceback.print_tb(result.exc_info[2]))
+        assert result.exit_code == 0
+        assert result.output.count("Synced: ") == 2
+        assert "2/2 runs done (2 synced, 0 incomplete, 0 skipped, 0 failed)" in (
+            result.output
+        )
+
+        # Check we marked both runs as synced
+        result = runner.invoke(cli.sync, ["--sync-all", "--jobs", "2"])
+        assert result.exit_code == 0
+        assert "wandb: ERROR Nothing to sync." in result.output
+
+
 def test_sync_wandb_run_and_tensorboard(runner, live_mock_server):
     with runner.isolated_filesystem():
         run_dir = os.path.join("wandb", "offline-run-20210216_154407-g9dvvkua")
@@ -1,3 +1,4 @@
+import hashlib
 import io
 import wandb
 from wandb import data_types
@@ -103,6 +104,32 @@ def test_bind_image(mocked_run):
     assert wb_image.is_bound()
 
 
+def test_image_async_encoding(mocked_run, mocker):
+    mocker.patch("wandb.sdk.data_types.image._async_media_enabled", return_value=True)
+    pixels = np.random.randint(255, size=(28, 32, 3))
+    wb_image = wandb.Image(pixels)
+    pixels[:] = 0  # changes after creating the image aren't logged
+    assert wb_image._width == 32 and wb_image._height == 28
+    wb_image.bind_to_run(mocked_run, "stuff", 10)
+    with open(wb_image._path, "rb") as f:
+        assert hashlib.sha256(f.read()).hexdigest() == wb_image._sha256
+    assert wb_image._size == os.path.getsize(wb_image._path)
+    assert wb_image.image.getpixel((0, 0)) != (0, 0, 0)
+    assert wb_image.to_json(mocked_run)["width"] == 32
+
+
+def test_log_image_async(live_mock_server, test_settings, parse_ctx):
+    test_settings.update(_async_media=True)
+    run = wandb.init(settings=test_settings)
+    for i in range(3):
+        run.log({"img": [wandb.Image(np.random.random((16, 16, 3)))] * 2, "i": i})
+        run.log({"j": i})
+    run.finish()
+    history = parse_ctx(live_mock_server.get_ctx()).history
+    assert [row.get("i", row.get("j")) for row in history] == [0, 0, 1, 1, 2, 2]
+    assert history[0]["img"]["count"] == 2
+
+
 full_box = {
     "position": {"middle": (0.5, 0.5), "width": 0.1, "height": 0.2},
     "class_id": 2,
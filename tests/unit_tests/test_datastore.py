@@ -142,3 +142,99 @@ def test_data_write_fill(with_datastore):
         expected_records=records,
         expected_record_sizes=lengths,
     )
+
+
+def test_group_commit_defers_fsync(with_datastore, mocker):
+    """Spanning records are not fsync'ed until the commit budget is used up."""
+    ds = datastore.DataStore(group_commit=True, commit_interval=60, commit_bytes=65536)
+    with_datastore.close()
+    os.unlink(FNAME)
+    ds.open_for_write(FNAME)
+    fsync = mocker.patch("os.fsync")
+    ds._write_data(b"\x01" * 40000)
+    assert fsync.call_count == 0
+    assert ds.durable_offset == 0
+    ds._write_data(b"\x02" * 40000)
+    assert fsync.call_count == 1
+    assert ds.durable_offset == ds._index
+    ds.close()
+
+
+def test_group_commit_close(with_datastore):
+    """Closing a group commit datastore makes all data durable."""
+    ds = datastore.DataStore(group_commit=True, commit_interval=60)
+    with_datastore.close()
+    os.unlink(FNAME)
+    ds.open_for_write(FNAME)
+    ds._write_data(b"\x01" * 100)
+    assert ds.durable_offset == 0
+    ds.close()
+    assert ds.durable_offset == 7 + 7 + 100
+    assert os.stat(FNAME).st_size == ds.durable_offset
+
+
+def _write_records(ds, records):
+    for record in records:
+        ds.write(record)
+    ds.close()
+
+
+def _history(step, size=1):
+    rec = wandb_internal_pb2.Record()
+    item = rec.history.item.add()
+    item.key = "_step"
+    item.value_json = json.dumps(step)
+    item = rec.history.item.add()
+    item.key = "data"
+    item.value_json = json.dumps("x" * size)
+    return rec
+
+
+def _summary(value):
+    rec = wandb_internal_pb2.Record()
+    item = rec.summary.update.add()
+    item.key = "value"
+    item.value_json = json.dumps(value)
+    return rec
+
+
+def test_mmap_scan(with_datastore):
+    """Scanning a memory-mapped file returns the same records, including spanning ones."""
+    records = [_history(step, size=step * 10000) for step in range(8)]
+    _write_records(with_datastore, records)
+
+    ds = datastore.DataStore()
+    ds.open_for_scan(FNAME, use_mmap=True)
+    for record in records:
+        assert ds.scan_data() == record.SerializeToString()
+    assert ds.scan_data() is None
+    ds.close()
+
+
+def test_index_seek(with_datastore):
+    """Seek to history steps and the last summary using the sidecar index."""
+    records = []
+    for step in range(20):
+        records.append(_history(step, size=5000))
+        records.append(_summary(step))
+    _write_records(with_datastore, records)
+
+    ds = datastore.DataStore()
+    ds.open_for_scan(FNAME, use_mmap=True)
+    index = ds.build_index()
+    assert len(index) == len(records)
+    assert len(index.offsets("summary")) == 20
+
+    ds.seek(index.offset_for_step(7))
+    assert ds.scan_data() == records[14].SerializeToString()
+    ds.seek(index.last("summary"))
+    assert ds.scan_data() == records[-1].SerializeToString()
+    assert index.offset_for_step(20) is None
+    ds.close()
+
+    # the saved index is reused when reopening
+    loaded = datastore.DataStoreIndex.load(FNAME + datastore.DATASTORE_INDEX_SUFFIX)
+    os.unlink(FNAME + datastore.DATASTORE_INDEX_SUFFIX)
+    assert loaded.size == os.stat(FNAME).st_size
+    assert loaded.offsets() == index.offsets()
+    assert loaded.offset_for_step(7) == index.offset_for_step(7)
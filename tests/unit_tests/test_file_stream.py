@@ -4,11 +4,13 @@ file_stream tests.
 
 from dataclasses import dataclass
 
+import gzip
 import json
 import pytest
 import os
 
-from wandb.sdk.internal.file_stream import CRDedupeFilePolicy
+import wandb
+from wandb.sdk.internal.file_stream import CRDedupeFilePolicy, FileStreamApi
 from wandb.sdk.lib import file_stream_utils
 from wandb import util
 
@@ -125,6 +127,62 @@ def test_fstream_requests_error(
     assert "Dropped streaming file chunk" in stderr
 
 
+def test_fstream_gzip(publish_util, mock_server, test_settings):
+    test_settings.update(
+        _file_stream_compression="gzip", source=wandb.sdk.wandb_settings.Source.INIT
+    )
+    assert_history(publish_util)
+
+
+def test_fstream_byte_budget(mocker):
+    api = mocker.MagicMock()
+    api.settings.return_value = dict(
+        base_url="http://localhost", entity="e", project="p"
+    )
+    api.dynamic_settings = {"heartbeat_seconds": 30}
+    mocker.patch.object(FileStreamApi, "MAX_BYTES_PER_PUSH", 10)
+    # far in the future so the rate limit never allows a post on its own
+    mocker.patch.object(FileStreamApi, "rate_limit_seconds", return_value=3600)
+    fs = FileStreamApi(api, "run", start_time=0)
+    sent = []
+    mocker.patch.object(
+        fs,
+        "_send",
+        side_effect=lambda chunks, uploaded: sent.append(list(chunks)) or True,
+    )
+    post = mocker.patch.object(fs, "_post")
+    mocker.patch.object(fs, "_read_queue", side_effect=lambda: [fs._queue.get()])
+
+    fs.push("output.log", "0123456789")
+    assert fs.stats()["pending_bytes"] == 10
+    assert fs.stats()["queue_depth"] == 1
+    fs.start()
+    fs.finish(0)
+    assert sent == [[("output.log", "0123456789")]]
+    assert post.call_args[0][0]["complete"]
+    stats = fs.stats()
+    assert stats["pending_bytes"] == 0
+    assert stats["queue_depth"] == 0
+
+
+def test_fstream_compress_payload(mocker):
+    api = mocker.MagicMock()
+    api.settings.return_value = dict(
+        base_url="http://localhost", entity="e", project="p"
+    )
+    fs = FileStreamApi(api, "run", start_time=0, compression="gzip")
+    response = mocker.MagicMock()
+    post = mocker.patch.object(fs._client, "post", return_value=response)
+    assert fs._post({"complete": True}) is response
+    kwargs = post.call_args[1]
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(kwargs["data"])) == {"complete": True}
+    assert fs.stats()["posts"] == 1
+
+    with pytest.raises(ValueError):
+        FileStreamApi(api, "run", start_time=0, compression="brotli")
+
+
 def test_crdedupe_consecutive_offsets():
     fp = CRDedupeFilePolicy()
     console = {1: "a", 2: "a", 3: "a", 8: "a", 12: "a", 13: "a", 30: "a"}
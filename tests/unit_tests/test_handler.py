@@ -0,0 +1,95 @@
+"""
+handler tests.
+"""
+
+import json
+
+from wandb.proto import wandb_internal_pb2 as pb
+from wandb.sdk.internal import handler
+from wandb.sdk.lib import proto_util
+
+
+def _history_record(**kwargs):
+    history = pb.HistoryRecord()
+    for k, v in kwargs.items():
+        item = history.item.add()
+        item.key = k
+        item.value_json = json.dumps(v)
+    return pb.Record(history=history)
+
+
+def _records(q, record_type):
+    records = []
+    while not q.empty():
+        record = q.get()
+        if record.WhichOneof("record_type") == record_type:
+            records.append(getattr(record, record_type))
+    return records
+
+
+def _summary_records(q):
+    records = []
+    while not q.empty():
+        record = q.get()
+        if record.WhichOneof("record_type") == "summary":
+            records.append(
+                (
+                    {
+                        item.key: json.loads(item.value_json)
+                        for item in record.summary.update
+                    },
+                    [item.key for item in record.summary.remove],
+                )
+            )
+    return records
+
+
+def test_summary_delta(internal_hm, internal_sender_q, mocker):
+    mocker.patch.object(handler, "SUMMARY_DEBOUNCE_SECONDS", 0)
+    internal_hm.handle(_history_record(a=1, b=2))
+    internal_hm.handle(_history_record(b=3))
+    assert _summary_records(internal_sender_q) == [
+        ({"a": 1, "b": 2, "_step": 0}, []),
+        ({"b": 3, "_step": 1}, []),
+    ]
+
+
+def test_summary_debounce(internal_hm, internal_sender_q, mocker):
+    mocker.patch.object(handler, "SUMMARY_DEBOUNCE_SECONDS", 3600)
+    internal_hm.handle(_history_record(a=1))
+    internal_hm.handle(_history_record(a=2, b=1))
+    internal_hm.handle(_history_record(c=1))
+    assert _summary_records(internal_sender_q) == [({"a": 1, "_step": 0}, [])]
+
+    summary = pb.SummaryRecord()
+    summary.remove.add().key = "b"
+    internal_hm.handle(pb.Record(summary=summary))
+    assert _summary_records(internal_sender_q) == []
+
+    internal_hm.finish()
+    assert _summary_records(internal_sender_q) == [
+        ({"a": 2, "c": 1, "_step": 2}, ["b"])
+    ]
+
+
+def test_partial_history_keeps_encoded_values(internal_hm, internal_sender_q):
+    record = pb.Record()
+    partial_history = record.request.partial_history
+    for k, v in (("a", "1.50"), ("b", '{"c": [1, 2]}')):
+        item = partial_history.item.add()
+        item.key = k
+        item.value_json = v
+    internal_hm.handle(record)
+    (history,) = _records(internal_sender_q, "history")
+    assert {item.key: item.value_json for item in history.item} == {
+        "a": "1.50",
+        "b": '{"c": [1, 2]}',
+        "_step": "0",
+    }
+
+
+def test_json_from_proto_list():
+    history = _history_record(a=1.5, b="x", c={"d": [1, None]}, e=True).history
+    history_json = proto_util.json_from_proto_list(history.item)
+    assert json.loads(history_json) == proto_util.dict_from_proto_list(history.item)
+    assert history_json == json.dumps(proto_util.dict_from_proto_list(history.item))
@@ -0,0 +1,47 @@
+import base64
+import hashlib
+import io
+
+import pytest
+from wandb.sdk.lib import hashutil
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+@pytest.mark.parametrize("size", [0, 1, 1000, 4096])
+def test_hash_file(tmp_path, use_mmap, size):
+    data = bytes(i % 251 for i in range(size))
+    path = tmp_path / "file"
+    path.write_bytes(data)
+    hashers = hashutil.hash_file(
+        str(path), ("md5", "sha256"), use_mmap=use_mmap, chunk_size=100
+    )
+    assert hashers["md5"].digest() == hashlib.md5(data).digest()
+    assert hashers["sha256"].digest() == hashlib.sha256(data).digest()
+
+
+def test_hash_files(tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"file{i}"
+        path.write_bytes(b"x" * i * 150)
+        paths.append(str(path))
+    hasher = hashutil.hash_files(paths, chunk_size=100)["md5"]
+    assert hasher.digest() == hashlib.md5(b"x" * 450).digest()
+
+
+def test_md5_file_b64(tmp_path):
+    path = tmp_path / "file"
+    path.write_bytes(b"hello")
+    expected = base64.b64encode(hashlib.md5(b"hello").digest()).decode("ascii")
+    assert hashutil.md5_file_b64(str(path)) == expected
+    assert hashutil.sha256_file_hex(str(path)) == hashlib.sha256(b"hello").hexdigest()
+
+
+def test_hashing_writer():
+    f = io.BytesIO()
+    writer = hashutil.HashingWriter(f, ("md5", "sha256"))
+    writer.write(b"hel")
+    writer.write(b"lo")
+    assert f.getvalue() == b"hello"
+    assert writer.size == 5
+    assert writer.hashers["sha256"].hexdigest() == hashlib.sha256(b"hello").hexdigest()
@@ -196,6 +196,44 @@ def test_run_history_keys_bad_arg(mock_server, api, capsys):
     assert "wandb: ERROR keys argument must be a list of strings\n" in captured.err
 
 
+def test_run_scan_history_arrow(mock_server, api):
+    pa = pytest.importorskip("pyarrow")
+    run = api.run("test/test/test")
+    batches = run.scan_history(page_size=1, min_step=0, max_step=2, format="arrow")
+    table = pa.Table.from_batches(list(batches), schema=batches.schema)
+    assert table.schema.field("acc").type == pa.float64()
+    assert (
+        table.to_pylist()
+        == [
+            {"acc": 10, "loss": 90},
+            {"acc": 20, "loss": 80},
+            {"acc": 30, "loss": 70},
+        ]
+        * 2
+    )
+
+
+def test_run_scan_history_arrow_mixed_types():
+    pa = pytest.importorskip("pyarrow")
+    scan = wandb.apis.public.HistoryArrowScan(None)
+    batch = scan._to_batch(pa, [{"_step": 0, "acc": 1, "img": {"_type": "image"}}])
+    batch = scan._to_batch(pa, [{"_step": 1, "acc": "nan"}])
+    assert batch.to_pylist() == [{"_step": 1, "acc": None, "img": None}]
+    assert scan.schema.field("_step").type == pa.int64()
+    assert scan.schema.field("img").type == pa.string()
+
+
+def test_run_history_to_parquet(mock_server, api, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    run = api.run("test/test/test")
+    path = str(tmp_path / "history.parquet")
+    assert run.history_to_parquet(path, keys=["acc", "loss"], max_step=1) == 2
+    assert pq.read_table(path).to_pylist() == [
+        {"loss": 0, "acc": 100},
+        {"loss": 1, "acc": 0},
+    ]
+
+
 def test_run_config(mock_server, api):
     run = api.run("test/test/test")
     assert run.config == {"epochs": 10}
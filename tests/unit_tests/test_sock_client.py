@@ -0,0 +1,163 @@
+"""sock client tests."""
+
+import socket
+import struct
+import threading
+
+import pytest
+from wandb.proto import wandb_internal_pb2 as pb
+from wandb.proto import wandb_server_pb2 as spb
+from wandb.sdk.interface.interface_sock import RecordBatcher
+from wandb.sdk.lib.sock_client import SockClient, SockClientClosedError
+from wandb.sdk.service.port_file import PortFile
+from wandb.sdk.wandb_manager import _ManagerToken
+
+
+@pytest.fixture()
+def sock_pair():
+    left, right = socket.socketpair()
+    sender, receiver = SockClient(), SockClient()
+    sender.set_socket(left)
+    receiver.set_socket(right)
+    yield sender, receiver
+    sender.close()
+    receiver.close()
+
+
+def _record(size):
+    record = pb.Record()
+    record.output.line = "x" * size
+    return record
+
+
+def test_read_many_small(sock_pair):
+    sender, receiver = sock_pair
+    for i in range(1000):
+        sender.send_record_publish(_record(i % 50))
+        if i % 100 == 99:
+            for j in range(i - 99, i + 1):
+                request = receiver.read_server_request()
+                assert request.record_publish.output.line == "x" * (j % 50)
+
+
+class _ChunkedSocket:
+    """Socket stand-in that returns the data a few bytes at a time."""
+
+    def __init__(self, data, chunk):
+        self._data = data
+        self._chunk = chunk
+        self._pos = 0
+
+    def recv_into(self, buf):
+        n = min(self._chunk, len(buf), len(self._data) - self._pos)
+        buf[:n] = self._data[self._pos : self._pos + n]
+        self._pos += n
+        return n
+
+    def settimeout(self, timeout):
+        pass
+
+
+def test_read_partial_frames():
+    data = b""
+    for i in range(10):
+        request = spb.ServerRequest()
+        request.record_publish.CopyFrom(_record(i * 7))
+        body = request.SerializeToString()
+        data += struct.pack("<BI", ord("W"), len(body)) + body
+    receiver = SockClient()
+    receiver.set_socket(_ChunkedSocket(data, chunk=3))
+    for i in range(10):
+        request = receiver.read_server_request()
+        assert request.record_publish.output.line == "x" * (i * 7)
+    with pytest.raises(SockClientClosedError):
+        receiver.read_server_request()
+
+
+def test_read_larger_than_buffer(sock_pair):
+    sender, receiver = sock_pair
+    size = SockClient.BUFSIZE * 3 + 17
+
+    def send():
+        for n in (10, size, 20):
+            sender.send_record_publish(_record(n))
+
+    thread = threading.Thread(target=send)
+    thread.start()
+    assert receiver.read_server_request().record_publish.output.line == "x" * 10
+    assert receiver.read_server_request().record_publish.output.line == "x" * size
+    assert receiver.read_server_request().record_publish.output.line == "x" * 20
+    thread.join()
+    assert len(receiver._buf) >= size
+
+
+def test_read_timeout_and_close(sock_pair):
+    sender, receiver = sock_pair
+    assert receiver.read_server_response(timeout=0.1) is None
+    sender.shutdown(socket.SHUT_RDWR)
+    with pytest.raises(SockClientClosedError):
+        receiver.read_server_response()
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="requires unix sockets")
+def test_connect_unix(tmp_path):
+    path = str(tmp_path / "socket")
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen(1)
+    client = SockClient()
+    client.connect_unix(path)
+    conn, _ = server.accept()
+    receiver = SockClient()
+    receiver.set_socket(conn)
+    inform_teardown = spb.ServerInformTeardownRequest(exit_code=3)
+    client.send(inform_teardown=inform_teardown)
+    assert receiver.read_server_request().inform_teardown.exit_code == 3
+    client.close()
+    receiver.close()
+    server.close()
+
+
+def test_port_file_unix_path(tmp_path):
+    fname = str(tmp_path / "ports.txt")
+    PortFile(sock_port=1234, unix_path="/tmp/wandb-service-x/socket").write(fname)
+    pf = PortFile()
+    pf.read(fname)
+    assert pf.is_valid
+    assert pf.sock_port == 1234
+    assert pf.unix_path == "/tmp/wandb-service-x/socket"
+
+
+def test_manager_token_unix_path():
+    token = _ManagerToken.from_params(
+        transport="unix", host="/tmp/wandb-service-a-b/socket", port=1234
+    )
+    assert token.transport == "unix"
+    assert token.host == "/tmp/wandb-service-a-b/socket"
+    assert token.port == 1234
+
+
+def test_record_batcher(sock_pair):
+    sender, receiver = sock_pair
+    batcher = RecordBatcher(sender, max_records=4, max_wait=60)
+    for i in range(6):
+        batcher.add(_record(i))
+    request = receiver.read_server_request()
+    records = request.record_publish_batch.record
+    assert [r.output.line for r in records] == ["x" * i for i in range(4)]
+
+    # the remaining records are only sent when flushed
+    assert receiver.read_server_response(timeout=0.1) is None
+    batcher.flush()
+    request = receiver.read_server_request()
+    assert len(request.record_publish_batch.record) == 2
+    batcher.stop()
+
+
+def test_record_batcher_interval(sock_pair):
+    sender, receiver = sock_pair
+    batcher = RecordBatcher(sender, max_records=64, max_wait=0.01)
+    batcher.add(_record(1))
+    request = receiver.read_server_request()
+    assert len(request.record_publish_batch.record) == 1
+    batcher.stop()
@@ -118,3 +118,62 @@ def test_artifacts_cache_cleanup_tmp_files(runner):
         reclaimed_bytes = cache.cleanup(10000)
 
         assert reclaimed_bytes == 1000
+
+
+def test_artifacts_cache_index_hit(runner, mocker):
+    with runner.isolated_filesystem():
+        cache = wandb_sdk.wandb_artifacts.ArtifactsCache("cache")
+        path, exists, opener = cache.check_etag_obj_path("abcdef", 2)
+        assert exists is False
+        with opener() as f:
+            f.write("hi")
+
+        # a new cache instance (or process) sees the object through the index
+        cache = wandb_sdk.wandb_artifacts.ArtifactsCache("cache")
+        isfile = mocker.patch("os.path.isfile")
+        _, exists, _ = cache.check_etag_obj_path("abcdef", 2)
+        assert exists is True
+        assert not isfile.called
+
+        # size mismatches are misses
+        _, exists, _ = cache.check_etag_obj_path("abcdef", 3)
+        assert exists is False
+
+
+def test_artifacts_cache_evict_lru(runner):
+    with runner.isolated_filesystem():
+        cache = wandb_sdk.wandb_artifacts.ArtifactsCache("cache", max_size=5000)
+        # run eviction inline so the test doesn't depend on the background thread
+        cache._maybe_evict = lambda: None
+        for etag in ("aa0001", "ab0002", "ac0003"):
+            _, _, opener = cache.check_etag_obj_path(etag, 2000)
+            with opener() as f:
+                f.write("x" * 2000)
+            time.sleep(0.01)
+
+        # using the oldest object makes the second one the least recently used
+        _, exists, _ = cache.check_etag_obj_path("aa0001", 2000)
+        assert exists is True
+        cache._index.flush()
+
+        assert cache._index.total_size() == 6000
+        reclaimed_bytes = cache._index.evict(5000)
+        assert reclaimed_bytes == 2000
+        assert cache._index.total_size() == 4000
+        assert not os.path.exists(os.path.join("cache", "obj", "etag", "ab", "0002"))
+        assert os.path.exists(os.path.join("cache", "obj", "etag", "aa", "0001"))
+
+
+def test_artifacts_cache_evict_background(runner):
+    with runner.isolated_filesystem():
+        cache = wandb_sdk.wandb_artifacts.ArtifactsCache("cache", max_size=3000)
+        for etag in ("aa0001", "ab0002"):
+            _, _, opener = cache.check_etag_obj_path(etag, 2000)
+            with opener() as f:
+                f.write("x" * 2000)
+
+        for _ in range(50):
+            if cache._index.total_size() <= 3000:
+                break
+            time.sleep(0.1)
+        assert cache._index.total_size() == 2000
@@ -210,6 +210,38 @@ def test_add_dir(runner):
         }
 
 
+def test_add_dir_hash_cache(runner, mocker):
+    with runner.isolated_filesystem():
+        os.mkdir("data")
+        for i in range(3):
+            with open(os.path.join("data", f"file{i}.txt"), "w") as f:
+                f.write(f"hello {i}")
+            # files modified just now aren't cached, they may still change
+            os.utime(os.path.join("data", f"file{i}.txt"), (1, 1))
+        cache = wandb.wandb_sdk.wandb_artifacts.ArtifactsCache("cache")
+        md5 = mocker.spy(wandb.sdk.interface.artifacts, "md5_file_b64")
+
+        def add_dir():
+            artifact = wandb.Artifact(type="dataset", name="my-arty")
+            artifact._cache = cache
+            artifact.add_dir("data")
+            return artifact.digest
+
+        digest = add_dir()
+        assert md5.call_count == 3
+
+        # unchanged files are not hashed again, even by a new process
+        cache = wandb.wandb_sdk.wandb_artifacts.ArtifactsCache("cache")
+        assert add_dir() == digest
+        assert md5.call_count == 3
+
+        with open(os.path.join("data", "file0.txt"), "w") as f:
+            f.write("changed")
+        os.utime(os.path.join("data", "file0.txt"), (2, 2))
+        assert add_dir() != digest
+        assert md5.call_count == 4
+
+
 def test_add_named_dir(runner):
     with runner.isolated_filesystem():
         open("file1.txt", "w").write("hello")
@@ -1396,3 +1428,51 @@ def test_communicate_artifact(runner, publish_util, mocked_run):
         artifact_publish = dict(run=mocked_run, artifact=artifact, aliases=["latest"])
         ctx_util = publish_util(artifacts=[artifact_publish])
         assert len(set(ctx_util.manifests_created_ids)) == 1
+
+
+class _RangeResponse:
+    def __init__(self, body, status_code):
+        self._body = body
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        for i in range(0, len(self._body), chunk_size):
+            yield self._body[i : i + chunk_size]
+
+
+@pytest.mark.parametrize("honor_ranges", [True, False])
+def test_load_file_range_download(runner, mocker, honor_ranges):
+    body = os.urandom(1000)
+    requested = []
+
+    def get(url, auth=None, stream=False, headers=None):
+        requested.append((headers or {}).get("Range"))
+        if honor_ranges and headers:
+            start, end = headers["Range"][len("bytes=") :].split("-")
+            return _RangeResponse(body[int(start) : int(end) + 1], 206)
+        return _RangeResponse(body, 200)
+
+    mocker.patch("wandb.sdk.wandb_artifacts.DOWNLOAD_RANGE_THRESHOLD", 500)
+    mocker.patch("wandb.sdk.wandb_artifacts._DOWNLOAD_RANGE_PART_SIZE", 300)
+    mocker.patch("wandb.sdk.wandb_artifacts._DOWNLOAD_CHUNK_SIZE", 64)
+    with runner.isolated_filesystem():
+        policy = wandb.wandb_sdk.wandb_artifacts.WandbStoragePolicy()
+        policy._cache = wandb.wandb_sdk.wandb_artifacts.ArtifactsCache("cache")
+        mocker.patch.object(policy._session, "get", side_effect=get)
+        mocker.patch.object(policy, "_file_url", return_value="http://test/obj")
+        entry = wandb.wandb_sdk.wandb_artifacts.ArtifactManifestEntry(
+            "big.bin", None, base64.b64encode(hashlib.md5(body).digest()), size=1000
+        )
+        path = policy.load_file(mocker.MagicMock(), "big.bin", entry)
+
+        with open(path, "rb") as f:
+            assert f.read() == body
+    if honor_ranges:
+        assert sorted(requested) == sorted(
+            ["bytes=0-299", "bytes=300-599", "bytes=600-899", "bytes=900-999"]
+        )
+    else:
+        assert requested == ["bytes=0-299"]
@@ -189,6 +189,13 @@ def run(ctx):
             ]
         },
         "sampledHistory": [[{"loss": 0, "acc": 100}, {"loss": 1, "acc": 0}]],
+        "historyKeys": {
+            "lastStep": 2,
+            "keys": {
+                "acc": {"typeCounts": [{"type": "number", "count": 3}]},
+                "loss": {"typeCounts": [{"type": "number", "count": 3}]},
+            },
+        },
         "shouldStop": False,
         "failed": False,
         "stopped": stopped,
@@ -670,6 +677,9 @@ def create_app(user_ctx=None):
             "RunFiles",
             "RunFullHistory",
             "RunSampledHistory",
+            "RunHistoryKeys",
+            "HistoryPage",
+            "SampledHistoryPage",
         ]:
             if f"query {query_name}(" in body["query"]:
                 # if querying state of run, change context from running to finished
@@ -2011,9 +2021,13 @@ index 30d74d2..9a2c773 100644
     def file_stream(entity, project, run):
         ctx = get_ctx()
         run_ctx = get_run_ctx(run)
+        if request.headers.get("Content-Encoding") == "gzip":
+            body = json.loads(gzip.decompress(request.get_data()))
+        else:
+            body = request.get_json()
         for c in ctx, run_ctx:
             c["file_stream"] = c.get("file_stream", [])
-            c["file_stream"].append(request.get_json())
+            c["file_stream"].append(body)
         response = json.dumps({"exitcode": None, "limits": {}})
 
         inject = InjectRequestsParse(ctx).find(request=request)
@@ -57,7 +57,11 @@ _lazyloader = wandb.wandb_lib.lazyloader
 # Call import module hook to setup any needed require hooks
 wandb.sdk.wandb_require._import_module_hook()
 
-from wandb import wandb_torch
+# Modules that are rarely needed right away are loaded on first use to keep
+# `import wandb` fast
+wandb_torch = _lazyloader.LazyLoader(
+    "wandb.wandb_torch", globals(), "wandb.wandb_torch"
+)
 
 # Move this (keras.__init__ expects it at top level)
 from wandb.data_types import Graph
@@ -79,10 +83,16 @@ from wandb.wandb_agent import agent
 
 # from wandb.core import *
 from wandb.viz import visualize
-from wandb import plot
-from wandb import plots  # deprecating this
+
+plot = _lazyloader.LazyLoader("wandb.plot", globals(), "wandb.plot")
+plots = _lazyloader.LazyLoader(
+    "wandb.plots", globals(), "wandb.plots"
+)  # deprecating this
 from wandb.integration.sagemaker import sagemaker_auth
-from wandb.sdk.internal import profiler
+
+profiler = _lazyloader.LazyLoader(
+    "wandb.profiler", globals(), "wandb.sdk.internal.profiler"
+)
 
 
 # Used to make sure we don't use some code in the incorrect process context
@@ -10,7 +10,8 @@ You might use the Public API to
 
 For more on using the Public API, check out [our guide](https://docs.wandb.com/guides/track/public-api-guide).
 """
-from collections import namedtuple
+from collections import deque, namedtuple
+import concurrent.futures
 import datetime
 from functools import partial
 import json
@@ -1947,7 +1948,15 @@ class Run(Attrs):
         return lines
 
     @normalize_exceptions
-    def scan_history(self, keys=None, page_size=1000, min_step=None, max_step=None):
+    def scan_history(
+        self,
+        keys=None,
+        page_size=1000,
+        min_step=None,
+        max_step=None,
+        format="dict",
+        workers=4,
+    ):
         """
         Returns an iterable collection of all history records for a run.
 
@@ -1960,14 +1969,27 @@ class Run(Attrs):
             losses = [row["Loss"] for row in history]
             ```
 
+            Load a run's history into pandas through arrow
+
+            ```python
+            batches = run.scan_history(format="arrow")
+            df = pyarrow.Table.from_batches(batches, schema=batches.schema).to_pandas()
+            ```
+
 
         Arguments:
             keys ([str], optional): only fetch these keys, and only fetch rows that have all of keys defined.
             page_size (int, optional): size of pages to fetch from the api
+            format (str, optional): "dict" to iterate over rows, or "arrow" to iterate over
+                a `pyarrow.RecordBatch` per page. Requires pyarrow.
+            workers (int, optional): number of pages fetched concurrently when format is "arrow"
 
         Returns:
-            An iterable collection over history records (dict).
+            An iterable collection over history records (dict), or record batches.
         """
+        if format not in ("dict", "arrow"):
+            wandb.termerror('format must be "dict" or "arrow"')
+            return []
         if keys is not None and not isinstance(keys, list):
             wandb.termerror("keys must be specified in a list")
             return []
@@ -1985,7 +2007,7 @@ class Run(Attrs):
         if max_step > last_step:
             max_step = last_step + 1
         if keys is None:
-            return HistoryScan(
+            scan = HistoryScan(
                 run=self,
                 client=self.client,
                 page_size=page_size,
@@ -1993,7 +2015,7 @@ class Run(Attrs):
                 max_step=max_step,
             )
         else:
-            return SampledHistoryScan(
+            scan = SampledHistoryScan(
                 run=self,
                 client=self.client,
                 keys=keys,
@@ -2001,6 +2023,53 @@ class Run(Attrs):
                 min_step=min_step,
                 max_step=max_step,
             )
+        if format == "arrow":
+            return HistoryArrowScan(scan, workers=workers)
+        return scan
+
+    def history_to_parquet(
+        self, path, keys=None, page_size=1000, min_step=None, max_step=None, workers=4
+    ):
+        """
+        Writes the history of a run to a parquet file, one page at a time.
+
+        Arguments:
+            path (str): the parquet file to write
+            keys ([str], optional): only export these keys, see `scan_history`
+            page_size (int, optional): size of pages to fetch from the api
+            workers (int, optional): number of pages fetched concurrently
+
+        Returns:
+            The number of rows written.
+        """
+        pq = util.get_module(
+            "pyarrow.parquet",
+            required="Exporting history to parquet requires pyarrow, run pip install pyarrow",
+        )
+        batches = self.scan_history(
+            keys=keys,
+            page_size=page_size,
+            min_step=min_step,
+            max_step=max_step,
+            format="arrow",
+            workers=workers,
+        )
+        if not isinstance(batches, HistoryArrowScan):
+            return 0
+        rows = 0
+        writer = None
+        try:
+            for batch in batches:
+                if writer is None:
+                    writer = pq.ParquetWriter(path, batches.schema)
+                writer.write_batch(batch)
+                rows += batch.num_rows
+            if writer is None:
+                writer = pq.ParquetWriter(path, batches.schema)
+        finally:
+            if writer is not None:
+                writer.close()
+        return rows
 
     @normalize_exceptions
     def logged_artifacts(self, per_page=100):
@@ -2806,20 +2875,23 @@ class HistoryScan:
         max_step = self.page_offset + self.page_size
         if max_step > self.max_step:
             max_step = self.max_step
+        self.rows = self._fetch(self.page_offset, max_step)
+        self.page_offset += self.page_size
+        self.scan_offset = 0
+
+    def _fetch(self, min_step, max_step):
         variables = {
             "entity": self.run.entity,
             "project": self.run.project,
             "run": self.run.id,
-            "minStep": int(self.page_offset),
+            "minStep": int(min_step),
             "maxStep": int(max_step),
             "pageSize": int(self.page_size),
         }
 
         res = self.client.execute(self.QUERY, variable_values=variables)
         res = res["project"]["run"]["history"]
-        self.rows = [json.loads(row) for row in res]
-        self.page_offset += self.page_size
-        self.scan_offset = 0
+        return [json.loads(row) for row in res]
 
 
 class SampledHistoryScan:
@@ -2873,6 +2945,11 @@ class SampledHistoryScan:
         max_step = self.page_offset + self.page_size
         if max_step > self.max_step:
             max_step = self.max_step
+        self.rows = self._fetch(self.page_offset, max_step)
+        self.page_offset += self.page_size
+        self.scan_offset = 0
+
+    def _fetch(self, min_step, max_step):
         variables = {
             "entity": self.run.entity,
             "project": self.run.project,
@@ -2880,7 +2957,7 @@ class SampledHistoryScan:
             "spec": json.dumps(
                 {
                     "keys": self.keys,
-                    "minStep": int(self.page_offset),
+                    "minStep": int(min_step),
                     "maxStep": int(max_step),
                     "samples": int(self.page_size),
                 }
@@ -2889,9 +2966,126 @@ class SampledHistoryScan:
 
         res = self.client.execute(self.QUERY, variable_values=variables)
         res = res["project"]["run"]["sampledHistory"]
-        self.rows = res[0]
-        self.page_offset += self.page_size
-        self.scan_offset = 0
+        return res[0]
+
+
+class HistoryArrowScan:
+    """Iterates over the pages of a history scan as `pyarrow.RecordBatch`es.
+
+    Up to `workers` pages are fetched concurrently ahead of the consumer and
+    yielded in step order. Every batch has the same schema: columns come from
+    the run's history keys (or the first page), numbers are stored as doubles
+    and nested values such as media are stored as JSON strings.
+    """
+
+    # types reported in the run's history keys that map onto flat arrow types
+    _KEY_TYPES = {"number": "float64", "string": "string", "boolean": "bool_"}
+    _INT_KEYS = ("_step",)
+
+    def __init__(self, scan, workers=4):
+        self.scan = scan
+        self.workers = max(1, workers)
+        self.schema = None
+
+    def __iter__(self):
+        pa = util.get_module(
+            "pyarrow",
+            required="Scanning history as arrow requires pyarrow, run pip install pyarrow",
+        )
+        if self.schema is None:
+            self.schema = self._schema_from_keys(pa)
+        ranges = iter(
+            (start, min(start + self.scan.page_size, self.scan.max_step))
+            for start in range(
+                self.scan.min_step, self.scan.max_step, self.scan.page_size
+            )
+        )
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.workers
+        ) as executor:
+            # keep a bounded number of pages in flight so memory stays flat
+            pending = deque()
+            for page in ranges:
+                pending.append(executor.submit(self.scan._fetch, *page))
+                if len(pending) >= 2 * self.workers:
+                    break
+            while pending:
+                rows = pending.popleft().result()
+                page = next(ranges, None)
+                if page is not None:
+                    pending.append(executor.submit(self.scan._fetch, *page))
+                if rows:
+                    yield self._to_batch(pa, rows)
+        if self.schema is None:
+            self.schema = pa.schema([])
+
+    def _schema_from_keys(self, pa):
+        history_keys = self.scan.run._attrs.get("historyKeys")
+        if isinstance(history_keys, str):
+            history_keys = json.loads(history_keys)
+        keys = (history_keys or {}).get("keys")
+        if not keys:
+            return None
+        wanted = getattr(self.scan, "keys", None)
+        fields = []
+        for name, info in keys.items():
+            if wanted is not None and name not in wanted:
+                continue
+            types = {t.get("type") for t in info.get("typeCounts", [])}
+            type_name = self._KEY_TYPES.get(types.pop()) if len(types) == 1 else None
+            fields.append(pa.field(name, self._field_type(pa, name, type_name)))
+        return pa.schema(fields)
+
+    def _schema_from_rows(self, pa, rows):
+        names = {}
+        for row in rows:
+            for name, value in row.items():
+                if isinstance(value, bool):
+                    type_name = "bool_"
+                elif isinstance(value, (int, float)):
+                    type_name = "float64"
+                elif isinstance(value, str):
+                    type_name = "string"
+                else:
+                    type_name = None
+                if names.setdefault(name, type_name) != type_name:
+                    names[name] = None
+        return pa.schema(
+            [pa.field(name, self._field_type(pa, name, t)) for name, t in names.items()]
+        )
+
+    def _field_type(self, pa, name, type_name):
+        if name in self._INT_KEYS:
+            return pa.int64()
+        return getattr(pa, type_name or "string")()
+
+    def _to_batch(self, pa, rows):
+        if self.schema is None:
+            self.schema = self._schema_from_rows(pa, rows)
+        arrays = [
+            self._to_array(pa, [row.get(field.name) for row in rows], field.type)
+            for field in self.schema
+        ]
+        return pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+    @staticmethod
+    def _to_array(pa, values, type_):
+        if pa.types.is_string(type_):
+            values = [
+                v if v is None or isinstance(v, str) else json.dumps(v) for v in values
+            ]
+        try:
+            return pa.array(values, type=type_)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # drop the values that don't fit the column, e.g. a string logged
+            # under a key that otherwise holds numbers
+            fitted = []
+            for v in values:
+                try:
+                    fitted.append(pa.scalar(v, type=type_).as_py())
+                except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+                    fitted.append(None)
+            return pa.array(fitted, type=type_)
 
 
 class ProjectArtifactTypes(Paginator):
@@ -3885,13 +4079,28 @@ class Artifact(artifacts.Artifact):
         # Force all the files to download into the same directory.
         # Download in parallel
         import multiprocessing.dummy  # this uses threads
-
+        from wandb.sdk.wandb_artifacts import DOWNLOAD_RANGE_THRESHOLD
+
+        # Large files are fetched as concurrent range requests, so only a few of
+        # them run at once to leave room in the connection pool for small files
+        small_files, large_files = [], []
+        for name, entry in manifest.entries.items():
+            if (entry.size or 0) >= DOWNLOAD_RANGE_THRESHOLD:
+                large_files.append(name)
+            else:
+                small_files.append(name)
         pool = multiprocessing.dummy.Pool(32)
-        pool.map(partial(self._download_file, root=dirpath), manifest.entries)
+        large_pool = multiprocessing.dummy.Pool(2)
+        download = partial(self._download_file, root=dirpath)
+        large_result = large_pool.map_async(download, large_files)
+        pool.map(download, small_files)
+        large_result.get()
         if recursive:
             pool.map(lambda artifact: artifact.download(), self._dependent_artifacts)
         pool.close()
+        large_pool.close()
         pool.join()
+        large_pool.join()
 
         self._is_downloaded = True
 
@@ -3901,8 +4110,9 @@ class Artifact(artifacts.Artifact):
             hours = int(delta // 3600)
             minutes = int((delta - hours * 3600) // 60)
             seconds = delta - hours * 3600 - minutes * 60
+            throughput = size / (1024 * 1024) / max(delta, 1e-6)
             termlog(
-                f"Done. {hours}:{minutes}:{seconds:.1f}",
+                f"Done. {hours}:{minutes}:{seconds:.1f} ({throughput:.1f}MB/s)",
                 prefix=False,
             )
         return dirpath
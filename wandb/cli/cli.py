@@ -258,6 +258,9 @@ def login(key, host, cloud, relogin, anonymously, no_offline=False):
 @click.option("--pid", default=None, type=int, help="The parent process id to monitor.")
 @click.option("--debug", is_flag=True, help="log debug info")
 @click.option("--serve-sock", is_flag=True, help="use socket mode")
+@click.option(
+    "--serve-unix", is_flag=True, help="also serve socket mode on a unix socket"
+)
 @click.option("--serve-grpc", is_flag=True, help="use grpc mode")
 @display_error
 def service(
@@ -268,6 +271,7 @@ def service(
     pid=None,
     debug=False,
     serve_sock=False,
+    serve_unix=False,
     serve_grpc=False,
 ):
     from wandb.sdk.service.server import WandbServer
@@ -280,6 +284,7 @@ def service(
         pid=pid,
         debug=debug,
         serve_sock=serve_sock,
+        serve_unix=serve_unix,
         serve_grpc=serve_grpc,
     )
     server.serve()
@@ -478,6 +483,13 @@ def init(ctx, project, entity, reset, mode):
     default=False,
     help="Clean without confirmation prompt.",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Number of runs to sync in parallel.",
+)
 @click.option("--ignore", hidden=True)
 @click.option("--show", default=5, help="Number of runs to show")
 @display_error
@@ -502,6 +514,7 @@ def sync(
     clean=None,
     clean_old_hours=24,
     clean_force=None,
+    jobs=1,
 ):
     # TODO: rather unfortunate, needed to avoid creating a `wandb` directory
     os.environ["WANDB_DIR"] = TMPDIR.name
@@ -569,12 +582,19 @@ def sync(
             view=view,
             verbose=verbose,
             sync_tensorboard=_sync_tensorboard,
+            jobs=jobs,
         )
         for p in _path:
             sm.add(p)
         sm.start()
         while not sm.is_done():
             _ = sm.poll()
+        if jobs > 1:
+            wandb.termlog(sm.stats.summary())
+        if sm.stats.failed:
+            wandb.termerror(
+                f"Failed to sync {len(sm.stats.failed)} runs, run sync again to retry them."
+            )
 
     def _sync_all():
         sync_items = get_runs(
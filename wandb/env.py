@@ -14,7 +14,6 @@ import os
 import sys
 import json
 import wandb
-from distutils.util import strtobool
 
 CONFIG_PATHS = "WANDB_CONFIG_PATHS"
 SWEEP_PARAM_PATH = "WANDB_SWEEP_PARAM_PATH"
@@ -66,6 +65,7 @@ ANONYMOUS = "WANDB_ANONYMOUS"
 JUPYTER = "WANDB_JUPYTER"
 CONFIG_DIR = "WANDB_CONFIG_DIR"
 CACHE_DIR = "WANDB_CACHE_DIR"
+CACHE_MAX_SIZE = "WANDB_CACHE_MAX_SIZE"
 DISABLE_SSL = "WANDB_INSECURE_DISABLE_SSL"
 SERVICE = "WANDB_SERVICE"
 SENTRY_DSN = "WANDB_SENTRY_DSN"
@@ -111,6 +111,19 @@ def immutable_keys():
     ]
 
 
+def strtobool(val: str) -> int:
+    """Convert a string representation of truth to 1 or 0.
+
+    Same as `distutils.util.strtobool`, which is slow to import and deprecated.
+    """
+    val = val.lower()
+    if val in ("y", "yes", "t", "true", "on", "1"):
+        return 1
+    if val in ("n", "no", "f", "false", "off", "0"):
+        return 0
+    raise ValueError(f"invalid truth value {val!r}")
+
+
 def _env_as_bool(var: str, default: str = None, env=None) -> bool:
     if env is None:
         env = os.environ
@@ -307,6 +320,12 @@ def get_cache_dir(env=None):
     return val
 
 
+def get_cache_max_size(default=None, env=None):
+    if env is None:
+        env = os.environ
+    return env.get(CACHE_MAX_SIZE, default)
+
+
 def get_use_v1_artifacts(env=None):
     if env is None:
         env = os.environ
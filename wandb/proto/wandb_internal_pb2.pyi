@@ -1610,17 +1610,44 @@ global___NetworkStatusRequest = NetworkStatusRequest
 class NetworkStatusResponse(google.protobuf.message.Message):
     DESCRIPTOR: google.protobuf.descriptor.Descriptor = ...
     NETWORK_RESPONSES_FIELD_NUMBER: builtins.int
+    FILE_STREAM_STATS_FIELD_NUMBER: builtins.int
 
     @property
     def network_responses(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___HttpResponse]: ...
 
+    @property
+    def file_stream_stats(self) -> global___FileStreamStats: ...
+
     def __init__(self,
         *,
         network_responses : typing.Optional[typing.Iterable[global___HttpResponse]] = ...,
+        file_stream_stats : typing.Optional[global___FileStreamStats] = ...,
         ) -> None: ...
-    def ClearField(self, field_name: typing_extensions.Literal[u"network_responses",b"network_responses"]) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal[u"file_stream_stats",b"file_stream_stats"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal[u"file_stream_stats",b"file_stream_stats",u"network_responses",b"network_responses"]) -> None: ...
 global___NetworkStatusResponse = NetworkStatusResponse
 
+class FileStreamStats(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor = ...
+    QUEUE_DEPTH_FIELD_NUMBER: builtins.int
+    PENDING_BYTES_FIELD_NUMBER: builtins.int
+    POSTS_FIELD_NUMBER: builtins.int
+    POST_LATENCY_FIELD_NUMBER: builtins.int
+    queue_depth: builtins.int = ...
+    pending_bytes: builtins.int = ...
+    posts: builtins.int = ...
+    post_latency: builtins.float = ...
+
+    def __init__(self,
+        *,
+        queue_depth : builtins.int = ...,
+        pending_bytes : builtins.int = ...,
+        posts : builtins.int = ...,
+        post_latency : builtins.float = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal[u"pending_bytes",b"pending_bytes",u"post_latency",b"post_latency",u"posts",b"posts",u"queue_depth",b"queue_depth"]) -> None: ...
+global___FileStreamStats = FileStreamStats
+
 class HttpResponse(google.protobuf.message.Message):
     DESCRIPTOR: google.protobuf.descriptor.Descriptor = ...
     HTTP_STATUS_CODE_FIELD_NUMBER: builtins.int
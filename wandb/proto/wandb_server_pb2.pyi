@@ -312,6 +312,20 @@ class ServerInformTeardownResponse(google.protobuf.message.Message):
         ) -> None: ...
 global___ServerInformTeardownResponse = ServerInformTeardownResponse
 
+class ServerRecordBatch(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor = ...
+    RECORD_FIELD_NUMBER: builtins.int
+
+    @property
+    def record(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[wandb.proto.wandb_internal_pb2.Record]: ...
+
+    def __init__(self,
+        *,
+        record : typing.Optional[typing.Iterable[wandb.proto.wandb_internal_pb2.Record]] = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal[u"record",b"record"]) -> None: ...
+global___ServerRecordBatch = ServerRecordBatch
+
 class ServerRequest(google.protobuf.message.Message):
     DESCRIPTOR: google.protobuf.descriptor.Descriptor = ...
     RECORD_PUBLISH_FIELD_NUMBER: builtins.int
@@ -322,6 +336,7 @@ class ServerRequest(google.protobuf.message.Message):
     INFORM_DETACH_FIELD_NUMBER: builtins.int
     INFORM_TEARDOWN_FIELD_NUMBER: builtins.int
     INFORM_START_FIELD_NUMBER: builtins.int
+    RECORD_PUBLISH_BATCH_FIELD_NUMBER: builtins.int
 
     @property
     def record_publish(self) -> wandb.proto.wandb_internal_pb2.Record: ...
@@ -347,6 +362,9 @@ class ServerRequest(google.protobuf.message.Message):
     @property
     def inform_start(self) -> global___ServerInformStartRequest: ...
 
+    @property
+    def record_publish_batch(self) -> global___ServerRecordBatch: ...
+
     def __init__(self,
         *,
         record_publish : typing.Optional[wandb.proto.wandb_internal_pb2.Record] = ...,
@@ -357,10 +375,11 @@ class ServerRequest(google.protobuf.message.Message):
         inform_detach : typing.Optional[global___ServerInformDetachRequest] = ...,
         inform_teardown : typing.Optional[global___ServerInformTeardownRequest] = ...,
         inform_start : typing.Optional[global___ServerInformStartRequest] = ...,
+        record_publish_batch : typing.Optional[global___ServerRecordBatch] = ...,
         ) -> None: ...
-    def HasField(self, field_name: typing_extensions.Literal[u"inform_attach",b"inform_attach",u"inform_detach",b"inform_detach",u"inform_finish",b"inform_finish",u"inform_init",b"inform_init",u"inform_start",b"inform_start",u"inform_teardown",b"inform_teardown",u"record_communicate",b"record_communicate",u"record_publish",b"record_publish",u"server_request_type",b"server_request_type"]) -> builtins.bool: ...
-    def ClearField(self, field_name: typing_extensions.Literal[u"inform_attach",b"inform_attach",u"inform_detach",b"inform_detach",u"inform_finish",b"inform_finish",u"inform_init",b"inform_init",u"inform_start",b"inform_start",u"inform_teardown",b"inform_teardown",u"record_communicate",b"record_communicate",u"record_publish",b"record_publish",u"server_request_type",b"server_request_type"]) -> None: ...
-    def WhichOneof(self, oneof_group: typing_extensions.Literal[u"server_request_type",b"server_request_type"]) -> typing_extensions.Literal["record_publish","record_communicate","inform_init","inform_finish","inform_attach","inform_detach","inform_teardown","inform_start"]: ...
+    def HasField(self, field_name: typing_extensions.Literal[u"inform_attach",b"inform_attach",u"inform_detach",b"inform_detach",u"inform_finish",b"inform_finish",u"inform_init",b"inform_init",u"inform_start",b"inform_start",u"inform_teardown",b"inform_teardown",u"record_communicate",b"record_communicate",u"record_publish",b"record_publish",u"record_publish_batch",b"record_publish_batch",u"server_request_type",b"server_request_type"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal[u"inform_attach",b"inform_attach",u"inform_detach",b"inform_detach",u"inform_finish",b"inform_finish",u"inform_init",b"inform_init",u"inform_start",b"inform_start",u"inform_teardown",b"inform_teardown",u"record_communicate",b"record_communicate",u"record_publish",b"record_publish",u"record_publish_batch",b"record_publish_batch",u"server_request_type",b"server_request_type"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal[u"server_request_type",b"server_request_type"]) -> typing_extensions.Literal["record_publish","record_communicate","inform_init","inform_finish","inform_attach","inform_detach","inform_teardown","inform_start","record_publish_batch"]: ...
 global___ServerRequest = ServerRequest
 
 class ServerResponse(google.protobuf.message.Message):
@@ -18,7 +18,6 @@ import wandb
 
 from ..interface.interface import InterfaceBase
 from ..interface.interface_queue import InterfaceQueue
-from ..internal.internal import wandb_internal
 from ..wandb_manager import _Manager
 from ..wandb_settings import Settings
 
@@ -150,7 +149,14 @@ class Backend:
 
             svc_iface_sock = cast("ServiceSockInterface", svc_iface)
             sock_client = svc_iface_sock._get_sock_client()
-            sock_interface = InterfaceSock(sock_client)
+            if self._settings is not None and self._settings._publish_batch:
+                sock_interface = InterfaceSock(
+                    sock_client,
+                    batch_records=self._settings._publish_batch_records,
+                    batch_interval=self._settings._publish_batch_interval,
+                )
+            else:
+                sock_interface = InterfaceSock(sock_client)
             self.interface = sock_interface
         elif svc_transport == "grpc":
             from ..interface.interface_grpc import InterfaceGrpc
@@ -183,6 +189,10 @@ class Backend:
             self._ensure_launched_manager()
             return
 
+        # the internal process code is only needed when it is launched from
+        # here, importing it eagerly slows down `import wandb`
+        from ..internal.internal import wandb_internal
+
         self.record_q = self._multiprocessing.Queue()
         self.result_q = self._multiprocessing.Queue()
         user_pid = os.getpid()
@@ -1,14 +1,26 @@
-import hashlib
+from concurrent.futures import Future, ThreadPoolExecutor
 import os
 import platform
 import shutil
-from typing import cast, Optional, Sequence, Type, TYPE_CHECKING, Union
+import threading
+from typing import (
+    Any,
+    Callable,
+    cast,
+    IO,
+    Optional,
+    Sequence,
+    Type,
+    TYPE_CHECKING,
+    Union,
+)
 
 import wandb
 from wandb import util
 from wandb._globals import _datatypes_callback
 
 from .wb_value import WBValue
+from ...lib import hashutil
 
 if TYPE_CHECKING:  # pragma: no cover
     import numpy as np  # type: ignore
@@ -20,6 +32,34 @@ if TYPE_CHECKING:  # pragma: no cover
 
 SYS_PLATFORM = platform.system()
 
+# media encoded in the background when the run enables `_async_media`,
+# creating more pending media than this blocks until some are done
+MEDIA_ENCODE_WORKERS = min(8, os.cpu_count() or 1)
+MAX_PENDING_MEDIA = 64
+
+_encode_pool: Optional[ThreadPoolExecutor] = None
+_encode_pool_pid: Optional[int] = None
+_encode_pool_lock = threading.Lock()
+_pending_media = threading.BoundedSemaphore(MAX_PENDING_MEDIA)
+
+
+def _get_encode_pool() -> ThreadPoolExecutor:
+    global _encode_pool, _encode_pool_pid, _pending_media
+    with _encode_pool_lock:
+        # the pool's threads don't survive a fork
+        if _encode_pool is None or _encode_pool_pid != os.getpid():
+            _encode_pool = ThreadPoolExecutor(
+                max_workers=MEDIA_ENCODE_WORKERS, thread_name_prefix="MediaEncoder"
+            )
+            _encode_pool_pid = os.getpid()
+            _pending_media = threading.BoundedSemaphore(MAX_PENDING_MEDIA)
+        return _encode_pool
+
+
+def _async_media_enabled() -> bool:
+    settings = getattr(wandb.run, "_settings", None)
+    return bool(settings is not None and settings._async_media)
+
 
 def _wb_filename(
     key: Union[str, int], step: Union[str, int], id: Union[str, int], extension: str
@@ -41,17 +81,26 @@ class Media(WBValue):
     _is_tmp: Optional[bool]
     _extension: Optional[str]
     _sha256: Optional[str]
+    _md5: Optional[str]
     _size: Optional[int]
+    _pending: Optional[Future]
 
     def __init__(self, caption: Optional[str] = None) -> None:
         super().__init__()
         self._path = None
+        self._md5 = None
+        self._pending = None
         # The run under which this object is bound, if any.
         self._run = None
         self._caption = caption
 
     def _set_file(
-        self, path: str, is_tmp: bool = False, extension: Optional[str] = None
+        self,
+        path: str,
+        is_tmp: bool = False,
+        extension: Optional[str] = None,
+        sha256: Optional[str] = None,
+        md5: Optional[str] = None,
     ) -> None:
         self._path = path
         self._is_tmp = is_tmp
@@ -62,10 +111,52 @@ class Media(WBValue):
             extension, path
         )
 
-        with open(self._path, "rb") as f:
-            self._sha256 = hashlib.sha256(f.read()).hexdigest()
+        if sha256 is None:
+            # the md5 is what artifacts identify files by, it's cheap to
+            # compute in the same pass and saves reading the file again if
+            # this ends up in an artifact, e.g. in a wandb.Table
+            hashers = hashutil.hash_file(self._path, ("sha256", "md5"))
+            sha256 = hashers["sha256"].hexdigest()
+            md5 = hashutil.b64_digest(hashers["md5"])
+        self._sha256 = sha256
+        self._md5 = md5
         self._size = os.path.getsize(self._path)
 
+    def _write_file(
+        self, path: str, write: Callable[[IO[bytes]], Any], is_tmp: bool = True
+    ) -> None:
+        """Writes the file with `write(f)` and sets it, hashing it as it is written."""
+        with open(path, "wb") as f:
+            writer = hashutil.HashingWriter(f, ("sha256", "md5"))
+            write(cast(IO[bytes], writer))
+        self._set_file(
+            path,
+            is_tmp=is_tmp,
+            sha256=writer.hashers["sha256"].hexdigest(),
+            md5=hashutil.b64_digest(writer.hashers["md5"]),
+        )
+
+    def _set_file_async(self, encode: Callable[[], None]) -> None:
+        """Runs `encode`, which must set the file, on the media encoding pool."""
+        pool = _get_encode_pool()
+        pending = _pending_media
+        pending.acquire()
+        try:
+            self._pending = pool.submit(encode)
+        except BaseException:
+            pending.release()
+            raise
+        self._pending.add_done_callback(lambda _: pending.release())
+
+    def _wait_for_file(self) -> None:
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            # re-raises any error from encoding the file
+            pending.result()
+
+    def _is_pending(self) -> bool:
+        return self._pending is not None and not self._pending.done()
+
     @classmethod
     def get_media_subdir(cls: Type["Media"]) -> str:
         raise NotImplementedError
@@ -83,6 +174,7 @@ class Media(WBValue):
         return self._run is not None
 
     def file_is_set(self) -> bool:
+        self._wait_for_file()
         return self._path is not None and self._sha256 is not None
 
     def bind_to_run(
@@ -157,6 +249,7 @@ class Media(WBValue):
         # into Media itself we should get rid of them
         from wandb.data_types import Audio
 
+        self._wait_for_file()
         json_obj = {}
         if isinstance(run, wandb.wandb_sdk.wandb_run.Run):
             json_obj.update(
@@ -236,8 +329,8 @@ class Media(WBValue):
                     ):
                         artifact.add_reference(self._path, name=name)
                     else:
-                        entry = artifact.add_file(
-                            self._path, name=name, is_tmp=self._is_tmp
+                        entry = artifact._add_file(
+                            self._path, name=name, is_tmp=self._is_tmp, digest=self._md5
                         )
                         name = entry.path
 
@@ -9,7 +9,7 @@ import wandb
 from wandb import util
 
 from ._private import MEDIA_TMP
-from .base_types.media import BatchableMedia, Media
+from .base_types.media import _async_media_enabled, BatchableMedia, Media
 from .helper_types.bounding_boxes_2d import BoundingBoxes2D
 from .helper_types.classes import Classes
 from .helper_types.image_mask import ImageMask
@@ -206,10 +206,12 @@ class Image(BatchableMedia):
                     for key in total_classes.keys()
                 ]
             )
-        self._width, self._height = self.image.size  # type: ignore
+        if self._width is None:
+            self._width, self._height = self.image.size  # type: ignore
         self._free_ram()
 
     def _initialize_from_wbimage(self, wbimage: "Image") -> None:
+        wbimage._wait_for_file()
         self._grouping = wbimage._grouping
         self._caption = wbimage._caption
         self._width = wbimage._width
@@ -220,6 +222,7 @@ class Image(BatchableMedia):
         self._is_tmp = wbimage._is_tmp
         self._extension = wbimage._extension
         self._sha256 = wbimage._sha256
+        self._md5 = wbimage._md5
         self._size = wbimage._size
         self.format = wbimage.format
         self._artifact_source = wbimage._artifact_source
@@ -249,11 +252,19 @@ class Image(BatchableMedia):
             "PIL.Image",
             required='wandb.Image needs the PIL package. To get it, run "pip install pillow".',
         )
+        self.format = "png"
         if util.is_matplotlib_typename(util.get_full_typename(data)):
             buf = BytesIO()
             util.ensure_matplotlib_figure(data).savefig(buf)
             self._image = pil_image.open(buf)
         elif isinstance(data, pil_image.Image):
+            if _async_media_enabled():
+                # copy so changes made to the image after logging it don't race
+                # with encoding it
+                image = data.copy()
+                self._width, self._height = image.size
+                self._set_file_async(lambda: self._save_png(image))
+                return
             self._image = data
         elif util.is_pytorch_tensor_typename(util.get_full_typename(data)):
             vis_util = util.get_module(
@@ -270,14 +281,27 @@ class Image(BatchableMedia):
                 data = data.numpy()
             if data.ndim > 2:
                 data = data.squeeze()  # get rid of trivial dimensions as a convenience
-            self._image = pil_image.fromarray(
-                self.to_uint8(data), mode=mode or self.guess_mode(data)
-            )
+            mode = mode or self.guess_mode(data)
+            if _async_media_enabled():
+                # only copy the buffer here, converting and encoding it happen
+                # on the media encoding pool
+                data = data.copy()
+                self._height, self._width = data.shape[:2]
+                self._set_file_async(
+                    lambda: self._save_png(
+                        pil_image.fromarray(self.to_uint8(data), mode=mode)
+                    )
+                )
+                return
+            self._image = pil_image.fromarray(self.to_uint8(data), mode=mode)
+
+        self._save_png(self._image)
 
+    def _save_png(self, image: "PIL.Image") -> None:
         tmp_path = os.path.join(MEDIA_TMP.name, str(util.generate_id()) + ".png")
-        self.format = "png"
-        self._image.save(tmp_path, transparency=None)
-        self._set_file(tmp_path, is_tmp=True)
+        self._write_file(
+            tmp_path, lambda f: image.save(f, format="PNG", transparency=None)
+        )
 
     @classmethod
     def from_json(
@@ -611,6 +635,7 @@ class Image(BatchableMedia):
 
     @property
     def image(self) -> Optional["PIL.Image"]:
+        self._wait_for_file()
         if self._image is None:
             if self._path is not None:
                 pil_image = util.get_module(
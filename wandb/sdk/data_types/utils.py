@@ -58,6 +58,21 @@ def history_dict_to_json(
     return payload
 
 
+def history_dict_has_pending_media(payload: dict) -> bool:
+    # True if any media in the History row is still being encoded in the background
+    for val in payload.values():
+        if isinstance(val, dict):
+            if history_dict_has_pending_media(val):
+                return True
+        elif isinstance(val, Media):
+            if val._is_pending():
+                return True
+        elif isinstance(val, Sequence) and not isinstance(val, str):
+            if any(isinstance(v, Media) and v._is_pending() for v in val):
+                return True
+    return False
+
+
 # TODO: refine this
 def val_to_json(
     run: "Optional[LocalRun]",
@@ -3,11 +3,16 @@ import binascii
 import codecs
 import contextlib
 import hashlib
+import logging
 import os
 import random
+import sqlite3
+import threading
+import time
 from typing import (
     Callable,
     Dict,
+    Iterator,
     List,
     Optional,
     Sequence,
@@ -21,6 +26,8 @@ from wandb import env
 from wandb import util
 from wandb.data_types import WBValue
 
+from ..lib import hashutil
+
 if TYPE_CHECKING:
     # need this import for type annotations, but want to avoid circular dependency
     from wandb.sdk import wandb_artifacts
@@ -31,6 +38,9 @@ if TYPE_CHECKING:
     import wandb.filesync.step_prepare.StepPrepare as StepPrepare  # type: ignore
 
 
+logger = logging.getLogger(__name__)
+
+
 def md5_string(string: str) -> str:
     hash_md5 = hashlib.md5()
     hash_md5.update(string.encode())
@@ -42,23 +52,11 @@ def b64_string_to_hex(string):
 
 
 def md5_hash_file(path):
-    hash_md5 = hashlib.md5()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(64 * 1024), b""):
-            hash_md5.update(chunk)
-    return hash_md5
+    return hashutil.hash_file(path)["md5"]
 
 
 def md5_hash_files(paths: List[str]):
-    hash_md5 = hashlib.md5()
-    # Create a mutable copy to sort
-    paths = [path for path in paths]
-    paths.sort()
-    for path in paths:
-        with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(64 * 1024), b""):
-                hash_md5.update(chunk)
-    return hash_md5
+    return hashutil.hash_files(sorted(paths))["md5"]
 
 
 def md5_file_b64(path: str) -> str:
@@ -865,11 +863,256 @@ class StorageHandler:
         pass
 
 
+class ArtifactsCacheIndex:
+    """Records the size and last use of every object in the artifacts cache.
+
+    The index is a sqlite database kept next to the objects, so hit checks and
+    eviction don't have to walk and stat the whole cache. Processes sharing a
+    cache directory share the index, sqlite's file locking serializes writers.
+    An existing cache is scanned once, when its index is created.
+
+    The index also remembers the md5 of local files added to artifacts, keyed
+    by path, inode, size and mtime, so unchanged files aren't hashed again.
+    """
+
+    _FILENAME = "index.db"
+    # seconds between writes of batched last use updates
+    _FLUSH_INTERVAL = 10
+    _EVICT_BATCH = 1000
+    # files modified this recently may change again within the same mtime tick
+    _RACY_HASH_NS = 2 * 10**9
+
+    def __init__(self, cache_dir: str) -> None:
+        self._cache_dir = cache_dir
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._touched: Dict[str, float] = {}
+        self._hashes: Dict[str, Tuple[int, int, int, str]] = {}
+        self._last_flush = time.time()
+
+    def _connection(self) -> sqlite3.Connection:
+        # connections can't be shared with forked children, reconnect there
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(
+                os.path.join(self._cache_dir, self._FILENAME),
+                timeout=30,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            with self._transaction(conn):
+                table = conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='table' AND name='objects'"
+                ).fetchone()
+                if table is None:
+                    conn.execute(
+                        "CREATE TABLE objects (path TEXT PRIMARY KEY, size INTEGER NOT NULL,"
+                        " last_used REAL NOT NULL, tmp INTEGER NOT NULL)"
+                    )
+                    conn.execute(
+                        "CREATE INDEX objects_last_used ON objects (last_used)"
+                    )
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO objects VALUES (?, ?, ?, ?)",
+                        self._scan(),
+                    )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS file_hashes (path TEXT PRIMARY KEY,"
+                    " inode INTEGER NOT NULL, size INTEGER NOT NULL,"
+                    " mtime_ns INTEGER NOT NULL, md5 TEXT NOT NULL)"
+                )
+            self._conn = conn
+            self._pid = os.getpid()
+            self._touched = {}
+            self._hashes = {}
+        return self._conn
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _scan(self) -> Iterator[Tuple[str, int, float, int]]:
+        for root, _, files in os.walk(os.path.join(self._cache_dir, "obj")):
+            for file in files:
+                path = os.path.join(root, file)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                tmp = file.startswith(ArtifactsCache._TMP_PREFIX)
+                yield self._key(path), stat.st_size, stat.st_atime, int(tmp)
+
+    def _key(self, path: str) -> str:
+        return os.path.relpath(path, self._cache_dir)
+
+    def get(self, path: str) -> Optional[int]:
+        """Returns the size of an indexed object and marks it used, None if unknown."""
+        key = self._key(path)
+        with self._lock:
+            row = (
+                self._connection()
+                .execute("SELECT size FROM objects WHERE path = ? AND tmp = 0", (key,))
+                .fetchone()
+            )
+            if row is None:
+                return None
+            self._touched[key] = time.time()
+            if time.time() - self._last_flush > self._FLUSH_INTERVAL:
+                self.flush()
+        return int(row[0])
+
+    def add(self, path: str, size: int, tmp: bool = False) -> None:
+        with self._lock:
+            self._connection().execute(
+                "INSERT OR REPLACE INTO objects VALUES (?, ?, ?, ?)",
+                (self._key(path), size, time.time(), int(tmp)),
+            )
+
+    def replace(self, tmp_path: str, path: str, size: int) -> None:
+        """Record that a finished temporary file was moved to its object path."""
+        with self._lock:
+            with self._transaction(self._connection()) as conn:
+                conn.execute(
+                    "DELETE FROM objects WHERE path = ?", (self._key(tmp_path),)
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO objects VALUES (?, ?, ?, 0)",
+                    (self._key(path), size, time.time()),
+                )
+
+    def get_file_md5(self, path: str, stat: os.stat_result) -> Optional[str]:
+        """Returns the md5 recorded for a local file, None if it may have changed."""
+        path = os.path.abspath(path)
+        with self._lock:
+            row = self._hashes.get(path)
+            if row is None:
+                row = (
+                    self._connection()
+                    .execute(
+                        "SELECT inode, size, mtime_ns, md5 FROM file_hashes WHERE path = ?",
+                        (path,),
+                    )
+                    .fetchone()
+                )
+        if row is None or tuple(row[:3]) != (
+            stat.st_ino,
+            stat.st_size,
+            stat.st_mtime_ns,
+        ):
+            return None
+        return row[3]
+
+    def add_file_md5(self, path: str, stat: os.stat_result, md5: str) -> None:
+        """Remember the md5 of a local file, written out on the next `flush`."""
+        if time.time_ns() - stat.st_mtime_ns < self._RACY_HASH_NS:
+            return
+        with self._lock:
+            self._hashes[os.path.abspath(path)] = (
+                stat.st_ino,
+                stat.st_size,
+                stat.st_mtime_ns,
+                md5,
+            )
+
+    def flush(self) -> None:
+        """Write out the last use times and file hashes batched up since the last flush."""
+        with self._lock:
+            touched, self._touched = self._touched, {}
+            hashes, self._hashes = self._hashes, {}
+            self._last_flush = time.time()
+            if not touched and not hashes:
+                return
+            with self._transaction(self._connection()) as conn:
+                conn.executemany(
+                    "UPDATE objects SET last_used = ? WHERE path = ?",
+                    [(used, key) for key, used in touched.items()],
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO file_hashes VALUES (?, ?, ?, ?, ?)",
+                    [(path,) + row for path, row in hashes.items()],
+                )
+
+    def total_size(self) -> int:
+        with self._lock:
+            row = (
+                self._connection()
+                .execute("SELECT SUM(size) FROM objects WHERE tmp = 0")
+                .fetchone()
+            )
+        return int(row[0] or 0)
+
+    def remove_tmp(self) -> int:
+        """Delete the temporary files of writes that never finished."""
+        with self._lock:
+            with self._transaction(self._connection()) as conn:
+                keys = [
+                    row[0]
+                    for row in conn.execute("SELECT path FROM objects WHERE tmp = 1")
+                ]
+                conn.execute("DELETE FROM objects WHERE tmp = 1")
+        bytes_reclaimed = 0
+        for key in keys:
+            path = os.path.join(self._cache_dir, key)
+            try:
+                size = os.path.getsize(path)
+                os.remove(path)
+            except OSError:
+                continue
+            bytes_reclaimed += size
+        return bytes_reclaimed
+
+    def evict(self, target_size: int) -> int:
+        """Delete the least recently used objects until the cache is below target_size.
+
+        Objects are evicted in batches so other processes can use the index in
+        between, returns the number of bytes reclaimed.
+        """
+        self.flush()
+        bytes_reclaimed = 0
+        while True:
+            with self._lock:
+                with self._transaction(self._connection()) as conn:
+                    row = conn.execute(
+                        "SELECT SUM(size) FROM objects WHERE tmp = 0"
+                    ).fetchone()
+                    total_size = int(row[0] or 0)
+                    evicted = []
+                    for key, size in conn.execute(
+                        "SELECT path, size FROM objects WHERE tmp = 0"
+                        " ORDER BY last_used LIMIT ?",
+                        (self._EVICT_BATCH,),
+                    ).fetchall():
+                        if total_size < target_size:
+                            break
+                        evicted.append(key)
+                        total_size -= size
+                        bytes_reclaimed += size
+                    conn.executemany(
+                        "DELETE FROM objects WHERE path = ?", [(k,) for k in evicted]
+                    )
+            for key in evicted:
+                try:
+                    os.remove(os.path.join(self._cache_dir, key))
+                except OSError:
+                    pass
+            if len(evicted) < self._EVICT_BATCH:
+                return bytes_reclaimed
+
+
 class ArtifactsCache:
 
     _TMP_PREFIX = "tmp"
+    # seconds between eviction passes when a max size is set
+    _EVICT_INTERVAL = 60
 
-    def __init__(self, cache_dir):
+    def __init__(self, cache_dir, max_size: Optional[int] = None):
         self._cache_dir = cache_dir
         util.mkdir_exists_ok(self._cache_dir)
         self._md5_obj_dir = os.path.join(self._cache_dir, "obj", "md5")
@@ -878,24 +1121,68 @@ class ArtifactsCache:
         self._random = random.Random()
         self._random.seed()
         self._artifacts_by_client_id = {}
+        self._index = ArtifactsCacheIndex(self._cache_dir)
+        self._max_size = max_size
+        self._evict_event = threading.Event()
+        self._evict_thread: Optional[threading.Thread] = None
 
     def check_md5_obj_path(self, b64_md5: str, size: int) -> Tuple[str, bool, Callable]:
         hex_md5 = util.bytes_to_hex(base64.b64decode(b64_md5))
         path = os.path.join(self._cache_dir, "obj", "md5", hex_md5[:2], hex_md5[2:])
-        opener = self._cache_opener(path)
-        if os.path.isfile(path) and os.path.getsize(path) == size:
-            return path, True, opener
-        util.mkdir_exists_ok(os.path.dirname(path))
-        return path, False, opener
+        return self._check_obj_path(path, size)
 
     def check_etag_obj_path(self, etag: str, size: int) -> Tuple[str, bool, Callable]:
         path = os.path.join(self._cache_dir, "obj", "etag", etag[:2], etag[2:])
+        return self._check_obj_path(path, size)
+
+    def _check_obj_path(self, path: str, size: int) -> Tuple[str, bool, Callable]:
         opener = self._cache_opener(path)
-        if os.path.isfile(path) and os.path.getsize(path) == size:
+        try:
+            indexed_size = self._index.get(path)
+        except sqlite3.Error as e:
+            logger.warning("Artifacts cache index unavailable: %s", e)
+            indexed_size = None
+        if indexed_size == size:
+            return path, True, opener
+        # objects written by clients that don't maintain the index
+        if (
+            indexed_size is None
+            and os.path.isfile(path)
+            and os.path.getsize(path) == size
+        ):
+            self._index_add(path, size)
             return path, True, opener
         util.mkdir_exists_ok(os.path.dirname(path))
         return path, False, opener
 
+    def file_md5_b64(self, path: str, stat: Optional[os.stat_result] = None) -> str:
+        """Hash a local file, reusing the digest from an earlier call if it's unchanged.
+
+        Call `flush` once done hashing to persist new digests for later processes.
+        """
+        stat = stat or os.stat(path)
+        try:
+            digest = self._index.get_file_md5(path, stat)
+        except sqlite3.Error as e:
+            logger.warning("Artifacts cache index unavailable: %s", e)
+            digest = None
+        if digest is None:
+            digest = md5_file_b64(path)
+            self._index.add_file_md5(path, stat, digest)
+        return digest
+
+    def flush(self) -> None:
+        try:
+            self._index.flush()
+        except sqlite3.Error as e:
+            logger.warning("Artifacts cache index unavailable: %s", e)
+
+    def _index_add(self, path: str, size: int, tmp: bool = False) -> None:
+        try:
+            self._index.add(path, size, tmp=tmp)
+        except sqlite3.Error as e:
+            logger.warning("Artifacts cache index unavailable: %s", e)
+
     def get_artifact(self, artifact_id):
         return self._artifacts_by_id.get(artifact_id)
 
@@ -909,38 +1196,29 @@ class ArtifactsCache:
         self._artifacts_by_client_id[artifact._client_id] = artifact
 
     def cleanup(self, target_size: int) -> int:
-        bytes_reclaimed: int = 0
-        paths: Dict[os.PathLike, os.stat_result] = {}
-        total_size: int = 0
-        for root, _, files in os.walk(self._cache_dir):
-            for file in files:
-                path = os.path.join(root, file)
-                stat = os.stat(path)
-
-                if file.startswith(ArtifactsCache._TMP_PREFIX):
-                    try:
-                        os.remove(path)
-                        bytes_reclaimed += stat.st_size
-                    except OSError:
-                        pass
-                    continue
-
-                paths[path] = stat
-                total_size += stat.st_size
-
-        sorted_paths = sorted(paths.items(), key=lambda x: x[1].st_atime)
-        for path, stat in sorted_paths:
-            if total_size < target_size:
-                return bytes_reclaimed
+        bytes_reclaimed = self._index.remove_tmp()
+        return bytes_reclaimed + self._index.evict(target_size)
+
+    def _maybe_evict(self) -> None:
+        """Wake up the eviction thread, starting it if needed."""
+        if self._max_size is None:
+            return
+        if self._evict_thread is None or not self._evict_thread.is_alive():
+            self._evict_thread = threading.Thread(
+                target=self._evict_loop, name="ArtifactsCacheEvictThread", daemon=True
+            )
+            self._evict_thread.start()
+        self._evict_event.set()
 
+    def _evict_loop(self) -> None:
+        while True:
+            self._evict_event.wait(self._EVICT_INTERVAL)
+            self._evict_event.clear()
             try:
-                os.remove(path)
-            except OSError:
-                pass
-
-            total_size -= stat.st_size
-            bytes_reclaimed += stat.st_size
-        return bytes_reclaimed
+                if self._index.total_size() > self._max_size:
+                    self._index.evict(self._max_size)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("Artifacts cache eviction failed: %s", e)
 
     def _cache_opener(self, path):
         @contextlib.contextmanager
@@ -954,6 +1232,8 @@ class ArtifactsCache:
                     util.rand_alphanumeric(length=8, rand=self._random),
                 ),
             )
+            # recorded so cleanup can find the file if this write never finishes
+            self._index_add(tmp_file, 0, tmp=True)
             with util.fsync_open(tmp_file, mode=mode) as f:
                 yield f
 
@@ -978,6 +1258,12 @@ class ArtifactsCache:
             except AttributeError:
                 os.rename(tmp_file, path)
 
+            try:
+                self._index.replace(tmp_file, path, os.path.getsize(path))
+            except sqlite3.Error as e:
+                logger.warning("Artifacts cache index unavailable: %s", e)
+            self._maybe_evict()
+
         return helper
 
 
@@ -988,5 +1274,9 @@ def get_artifacts_cache() -> ArtifactsCache:
     global _artifacts_cache
     if _artifacts_cache is None:
         cache_dir = os.path.join(env.get_cache_dir(), "artifacts")
-        _artifacts_cache = ArtifactsCache(cache_dir)
+        max_size = env.get_cache_max_size()
+        _artifacts_cache = ArtifactsCache(
+            cache_dir,
+            max_size=util.from_human_size(max_size) if max_size else None,
+        )
     return _artifacts_cache
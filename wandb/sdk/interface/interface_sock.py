@@ -5,7 +5,9 @@ See interface.py for how interface classes relate to each other.
 """
 
 import logging
-from typing import Any, Optional
+import threading
+import time
+from typing import Any, List, Optional
 from typing import TYPE_CHECKING
 
 
@@ -23,16 +25,97 @@ if TYPE_CHECKING:
 logger = logging.getLogger("wandb")
 
 
+class RecordBatcher:
+    """Coalesce published records into batches sent as a single message.
+
+    A batch is sent once it holds `max_records` records or `max_wait` seconds
+    after its first record was added, whichever comes first.
+    """
+
+    _records: List["pb.Record"]
+    _deadline: float
+
+    def __init__(
+        self, sock_client: SockClient, max_records: int, max_wait: float
+    ) -> None:
+        self._sock_client = sock_client
+        self._max_records = max_records
+        self._max_wait = max_wait
+        self._records = []
+        self._deadline = 0
+        self._stopped = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="RecordBatchThr")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def add(self, record: "pb.Record") -> None:
+        with self._cond:
+            self._records.append(record)
+            if len(self._records) >= self._max_records:
+                self._send()
+            elif len(self._records) == 1:
+                self._deadline = time.monotonic() + self._max_wait
+                self._cond.notify()
+
+    def flush(self) -> None:
+        with self._cond:
+            self._send()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._send()
+            self._stopped = True
+            self._cond.notify()
+        self._thread.join()
+
+    def _send(self) -> None:
+        # called with the lock held so that batches are sent in order
+        if not self._records:
+            return
+        records = self._records
+        self._records = []
+        self._sock_client.send_record_publish_batch(records)
+
+    def _run(self) -> None:
+        with self._cond:
+            while not self._stopped:
+                if not self._records:
+                    self._cond.wait()
+                    continue
+                remaining = self._deadline - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+                try:
+                    self._send()
+                except OSError as e:
+                    # the socket is gone, there is nobody left to send to
+                    logger.warning(f"Unable to send record batch: {e}")
+                    self._stopped = True
+
+
 class InterfaceSock(InterfaceShared):
     _stream_id: Optional[str]
     _sock_client: SockClient
-
-    def __init__(self, sock_client: SockClient) -> None:
+    _batcher: Optional[RecordBatcher]
+
+    def __init__(
+        self,
+        sock_client: SockClient,
+        batch_records: int = 0,
+        batch_interval: float = 0,
+    ) -> None:
         # _sock_client is used when abstract method _init_router() is called by constructor
         self._sock_client = sock_client
         super().__init__()
         self._process_check = False
         self._stream_id = None
+        self._batcher = None
+        if batch_records > 1:
+            self._batcher = RecordBatcher(
+                sock_client, max_records=batch_records, max_wait=batch_interval
+            )
 
     def _init_router(self) -> None:
         self._router = MessageSockRouter(self._sock_client)
@@ -48,16 +131,30 @@ class InterfaceSock(InterfaceShared):
 
     def _publish(self, record: "pb.Record", local: bool = None) -> None:
         self._assign(record)
-        self._sock_client.send_record_publish(record)
+        if not self._batcher:
+            self._sock_client.send_record_publish(record)
+            return
+        self._batcher.add(record)
+        if record.WhichOneof("record_type") == "exit":
+            self._batcher.flush()
 
     def _communicate_async(self, rec: "pb.Record", local: bool = None) -> MessageFuture:
         self._assign(rec)
+        # everything published so far has to be seen before this record
+        if self._batcher:
+            self._batcher.flush()
         assert self._router
         if self._process_check and self._process and not self._process.is_alive():
             raise Exception("The wandb backend process has shutdown")
         future = self._router.send_and_receive(rec, local=local)
         return future
 
+    def join(self) -> None:
+        if self._batcher:
+            self._batcher.stop()
+            self._batcher = None
+        super().join()
+
     def _communicate_stop_status(
         self, status: "pb.StopStatusRequest"
     ) -> Optional["pb.StopStatusResponse"]:
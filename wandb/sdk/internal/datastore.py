@@ -16,12 +16,17 @@ header :=
   version: uint8
 """
 
+import bisect
+import json
 import logging
+import mmap
 import os
 import struct
+import time
 import zlib
 
 import wandb
+from wandb.proto import wandb_internal_pb2  # type: ignore
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +45,17 @@ LEVELDBLOG_HEADER_MAGIC = (
 )
 LEVELDBLOG_HEADER_VERSION = 0
 
+# group commit defaults: make written data durable at least this often
+DATASTORE_COMMIT_INTERVAL_SECONDS = 0.2
+DATASTORE_COMMIT_BYTES = 4 * 1024 * 1024
+
+# sidecar index: header followed by (offset, record type, history step) entries
+DATASTORE_INDEX_SUFFIX = ".idx"
+DATASTORE_INDEX_IDENT = b"WBIX"
+DATASTORE_INDEX_VERSION = 0
+DATASTORE_INDEX_HEADER = struct.Struct("<4sBQ")
+DATASTORE_INDEX_ENTRY = struct.Struct("<QIq")
+
 try:
     bytes("", "ascii")
 
@@ -55,13 +71,124 @@ except Exception:
     # bytestostr = str
 
 
-class DataStore:
+class DataStoreIndex:
+    """Index of the records in a datastore file.
+
+    Each entry holds the file offset of a record, its record type and its
+    history step (-1 for records that are not history).  `size` is the file
+    offset up to which the datastore has been indexed.
+    """
+
     def __init__(self):
+        self.size = 0
+        self._offsets = []
+        self._types = []
+        self._history_steps = []
+        self._history_offsets = []
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def add(self, offset, record_type, step=-1):
+        self._offsets.append(offset)
+        self._types.append(record_type)
+        if record_type == "history" and step >= 0:
+            self._history_steps.append(step)
+            self._history_offsets.append(offset)
+
+    def offsets(self, record_type=None):
+        """Offsets of all records, or of all records of `record_type`."""
+        if record_type is None:
+            return list(self._offsets)
+        return [o for o, t in zip(self._offsets, self._types) if t == record_type]
+
+    def last(self, record_type):
+        """Offset of the last record of `record_type`, None if there is none."""
+        for i in range(len(self._types) - 1, -1, -1):
+            if self._types[i] == record_type:
+                return self._offsets[i]
+        return None
+
+    def offset_for_step(self, step):
+        """Offset of the first history record at or after `step`."""
+        i = bisect.bisect_left(self._history_steps, step)
+        if i == len(self._history_steps):
+            return None
+        return self._history_offsets[i]
+
+    def save(self, fname):
+        fields = wandb_internal_pb2.Record.DESCRIPTOR.fields_by_name
+        steps = dict(zip(self._history_offsets, self._history_steps))
+        with open(fname, "wb") as f:
+            f.write(
+                DATASTORE_INDEX_HEADER.pack(
+                    DATASTORE_INDEX_IDENT, DATASTORE_INDEX_VERSION, self.size
+                )
+            )
+            for offset, record_type in zip(self._offsets, self._types):
+                number = fields[record_type].number if record_type else 0
+                f.write(
+                    DATASTORE_INDEX_ENTRY.pack(offset, number, steps.get(offset, -1))
+                )
+
+    @classmethod
+    def load(cls, fname):
+        """Load a saved index, returns None if it is missing or invalid."""
+        try:
+            with open(fname, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        if len(data) < DATASTORE_INDEX_HEADER.size:
+            return None
+        ident, version, size = DATASTORE_INDEX_HEADER.unpack_from(data)
+        if ident != DATASTORE_INDEX_IDENT or version != DATASTORE_INDEX_VERSION:
+            return None
+        fields = wandb_internal_pb2.Record.DESCRIPTOR.fields_by_number
+        index = cls()
+        index.size = size
+        entries = data[DATASTORE_INDEX_HEADER.size :]
+        entries = entries[: len(entries) - len(entries) % DATASTORE_INDEX_ENTRY.size]
+        for offset, number, step in DATASTORE_INDEX_ENTRY.iter_unpack(entries):
+            field = fields.get(number)
+            index.add(offset, field.name if field else None, step)
+        return index
+
+
+class DataStore:
+    """leveldb log datastore.
+
+    By default every record that spans a block boundary is flushed and
+    fsync'ed to disk.  With `group_commit` enabled, writes are buffered and
+    made durable in groups: whenever `commit_bytes` have been written or
+    `commit_interval` seconds have passed since the last commit, or when
+    `commit()` is called explicitly.  `durable_offset` reports the file offset
+    up to which data is known to be on disk.
+
+    Files opened for scan with `use_mmap` are memory-mapped rather than read
+    one record at a time; checksums are only verified for the records that are
+    actually scanned, so `seek()` together with an index from `build_index()`
+    skips over the rest of the file without touching it.
+    """
+
+    def __init__(
+        self,
+        group_commit=False,
+        commit_interval=DATASTORE_COMMIT_INTERVAL_SECONDS,
+        commit_bytes=DATASTORE_COMMIT_BYTES,
+    ):
         self._opened_for_scan = False
         self._fp = None
+        self._mm = None
         self._index = 0
         self._size_bytes = 0
 
+        self._group_commit = group_commit
+        self._commit_interval = commit_interval
+        self._commit_bytes = commit_bytes
+        self._durable_index = 0
+        self._commit_time = time.monotonic()
+
         self._crc = [0] * (LEVELDBLOG_LAST + 1)
         for x in range(1, LEVELDBLOG_LAST + 1):
             self._crc[x] = zlib.crc32(strtobytes(chr(x))) & 0xFFFFFFFF
@@ -84,15 +211,77 @@ class DataStore:
         self._fp = open(fname, "wb")
         # do something with _index
 
-    def open_for_scan(self, fname):
+    def open_for_scan(self, fname, use_mmap=False):
         self._fname = fname
         logger.info("open for scan: %s", fname)
         self._fp = open(fname, "rb")
         self._index = 0
         self._size_bytes = os.stat(fname).st_size
         self._opened_for_scan = True
+        # an empty file can not be mapped, let the header check report it
+        if use_mmap and self._size_bytes >= LEVELDBLOG_HEADER_LEN:
+            self._mm = mmap.mmap(
+                self._fp.fileno(), self._size_bytes, access=mmap.ACCESS_READ
+            )
         self._read_header()
 
+    def _read(self, size):
+        if self._mm is None:
+            return self._fp.read(size)
+        return self._mm[self._index : self._index + size]
+
+    def seek(self, offset):
+        """Position the scan at a record offset, as returned by the index."""
+        assert self._opened_for_scan, "file not open for scanning"
+        self._index = offset
+        if self._mm is None:
+            self._fp.seek(offset)
+
+    def build_index(self, save=True):
+        """Index the records of the file opened for scanning.
+
+        A sidecar index saved next to the file is reused and only the records
+        written after it was saved are scanned.  The scan position is restored
+        when done.
+        """
+        assert self._opened_for_scan, "file not open for scanning"
+        index_fname = self._fname + DATASTORE_INDEX_SUFFIX
+        index = DataStoreIndex.load(index_fname)
+        if index is None or index.size > self._size_bytes:
+            index = DataStoreIndex()
+        if index.size == self._size_bytes:
+            return index
+
+        position = self._index
+        self.seek(index.size or LEVELDBLOG_HEADER_LEN)
+        while True:
+            offset = self._index
+            try:
+                data = self.scan_data()
+            except AssertionError:
+                # incomplete record at the end of a file still being written
+                if self.in_last_block():
+                    break
+                raise
+            if data is None:
+                break
+            record = wandb_internal_pb2.Record()
+            record.ParseFromString(data)
+            record_type = record.WhichOneof("record_type")
+            step = -1
+            if record_type == "history":
+                step = _history_step(record.history)
+            index.add(offset, record_type, step)
+            index.size = self._index
+        self.seek(position)
+
+        if save:
+            try:
+                index.save(index_fname)
+            except OSError as e:
+                logger.warning("unable to save index %s: %s", index_fname, e)
+        return index
+
     def in_last_block(self):
         """When reading, we want to know if we're in the last block to
         handle in progress writes"""
@@ -102,7 +291,7 @@ class DataStore:
         assert self._opened_for_scan, "file not open for scanning"
         # TODO(jhr): handle some assertions as file corruption issues
         # assume we have enough room to read header, checked by caller?
-        header = self._fp.read(LEVELDBLOG_HEADER_LEN)
+        header = self._read(LEVELDBLOG_HEADER_LEN)
         if len(header) == 0:
             return None
         assert (
@@ -114,7 +303,7 @@ class DataStore:
         checksum, dlength, dtype = fields
         # check len, better fit in the block
         self._index += LEVELDBLOG_HEADER_LEN
-        data = self._fp.read(dlength)
+        data = self._read(dlength)
         checksum_computed = zlib.crc32(data, self._crc[dtype]) & 0xFFFFFFFF
         assert (
             checksum == checksum_computed
@@ -129,7 +318,7 @@ class DataStore:
         space_left = LEVELDBLOG_BLOCK_LEN - offset
         if space_left < LEVELDBLOG_HEADER_LEN:
             pad_check = strtobytes("\x00" * space_left)
-            pad = self._fp.read(space_left)
+            pad = self._read(space_left)
             # verify they are zero
             assert pad == pad_check, "invalid padding"
             self._index += space_left
@@ -177,7 +366,7 @@ class DataStore:
         self._index += len(data)
 
     def _read_header(self):
-        header = self._fp.read(LEVELDBLOG_HEADER_LEN)
+        header = self._read(LEVELDBLOG_HEADER_LEN)
         assert (
             len(header) == LEVELDBLOG_HEADER_LEN
         ), "header is {} bytes instead of the expected {}".format(
@@ -252,8 +441,11 @@ class DataStore:
 
             # write last and flush the entire block to disk
             self._write_record(s[data_used:], LEVELDBLOG_LAST)
-            self._fp.flush()
-            os.fsync(self._fp.fileno())
+            if not self._group_commit:
+                self.commit()
+
+        if self._group_commit:
+            self.maybe_commit()
 
         return file_offset, self._index - file_offset, flush_index, flush_offset
 
@@ -274,7 +466,47 @@ class DataStore:
         ret = self._write_data(s)
         return ret
 
+    @property
+    def durable_offset(self):
+        """File offset up to which all written data has been fsync'ed."""
+        return self._durable_index
+
+    def commit(self):
+        """Flush buffered writes and fsync them to disk."""
+        if self._fp is None or self._opened_for_scan:
+            return
+        self._commit_time = time.monotonic()
+        if self._durable_index == self._index:
+            return
+        self._fp.flush()
+        os.fsync(self._fp.fileno())
+        self._durable_index = self._index
+
+    def maybe_commit(self):
+        """Commit if the group commit byte or time budget has been exceeded."""
+        pending = self._index - self._durable_index
+        if not pending:
+            return
+        if (
+            pending >= self._commit_bytes
+            or time.monotonic() - self._commit_time >= self._commit_interval
+        ):
+            self.commit()
+
     def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
         if self._fp is not None:
+            self.commit()
             logger.info("close: %s", self._fname)
             self._fp.close()
+
+
+def _history_step(history):
+    if history.HasField("step"):
+        return history.step.num
+    for item in history.item:
+        if item.key == "_step":
+            return json.loads(item.value_json)
+    return -1
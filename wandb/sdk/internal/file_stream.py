@@ -1,6 +1,8 @@
 import base64
 import collections
+import gzip
 import itertools
+import json
 import logging
 import os
 import queue
@@ -255,10 +257,25 @@ class FileStreamApi:
 
     HTTP_TIMEOUT = env.get_http_timeout(10)
     MAX_ITEMS_PER_PUSH = 10000
+    # Post early, without waiting out the rate limit, once this much data is ready
+    MAX_BYTES_PER_PUSH = 4 * 1024 * 1024
+    COMPRESSION_TYPES = ("gzip", "zstd")
 
-    def __init__(self, api, run_id, start_time, settings=None):
+    def __init__(self, api, run_id, start_time, settings=None, compression=None):
         if settings is None:
             settings = dict()
+        if compression is not None and compression not in self.COMPRESSION_TYPES:
+            raise ValueError(
+                "Unsupported file stream compression: {}".format(compression)
+            )
+        self._zstd = None
+        if compression == "zstd":
+            zstd = util.get_module(
+                "zstandard",
+                required="zstd file stream compression requires the zstandard library, run pip install zstandard",
+            )
+            self._zstd = zstd.ZstdCompressor()
+        self._compression = compression
         # NOTE: exc_info is set in thread_except_body context and readable by calling threads
         self._exc_info = None
         self._settings = settings
@@ -277,6 +294,11 @@ class FileStreamApi:
         )
         self._file_policies = {}
         self._dropped_chunks = 0
+        # backpressure stats, reported by the sender on network status requests
+        self._queued_bytes = 0
+        self._sent_bytes = 0
+        self._post_count = 0
+        self._post_latency = 0.0
         self._queue = queue.Queue()
         self._thread = threading.Thread(target=self._thread_except_body)
         # It seems we need to make this a daemon thread to get sync.py's atexit handler to run, which
@@ -339,6 +361,7 @@ class FileStreamApi:
         posted_data_time = time.time()
         posted_anything_time = time.time()
         ready_chunks = []
+        ready_bytes = 0
         uploaded = set()
         finished = None
         while finished is None:
@@ -347,15 +370,13 @@ class FileStreamApi:
                 if isinstance(item, self.Finish):
                     finished = item
                 elif isinstance(item, self.Preempting):
-                    request_with_retry(
-                        self._client.post,
-                        self._endpoint,
-                        json={
+                    self._post(
+                        {
                             "complete": False,
                             "preempting": True,
                             "dropped": self._dropped_chunks,
                             "uploaded": list(uploaded),
-                        },
+                        }
                     )
                     uploaded = set()
                 elif isinstance(item, self.PushSuccess):
@@ -363,16 +384,21 @@ class FileStreamApi:
                 else:
                     # item is Chunk
                     ready_chunks.append(item)
+                    ready_bytes += len(item.data)
 
             cur_time = time.time()
 
             if ready_chunks and (
-                finished or cur_time - posted_data_time > self.rate_limit_seconds()
+                finished
+                or cur_time - posted_data_time > self.rate_limit_seconds()
+                or ready_bytes >= self.MAX_BYTES_PER_PUSH
             ):
                 posted_data_time = cur_time
                 posted_anything_time = cur_time
                 success = self._send(ready_chunks, uploaded=uploaded)
+                self._sent_bytes += ready_bytes
                 ready_chunks = []
+                ready_bytes = 0
                 if success:
                     uploaded = set()
 
@@ -386,32 +412,62 @@ class FileStreamApi:
                 # list of uploaded files, don't reset the `uploaded`
                 # list. Retry publishing the list on the next attempt.
                 if not isinstance(
-                    request_with_retry(
-                        self._client.post,
-                        self._endpoint,
-                        json={
+                    self._post(
+                        {
                             "complete": False,
                             "failed": False,
                             "dropped": self._dropped_chunks,
                             "uploaded": list(uploaded),
-                        },
+                        }
                     ),
                     Exception,
                 ):
                     uploaded = set()
 
         # post the final close message. (item is self.Finish instance now)
-        request_with_retry(
-            self._client.post,
-            self._endpoint,
-            json={
+        self._post(
+            {
                 "complete": True,
                 "exitcode": int(finished.exitcode),
                 "dropped": self._dropped_chunks,
                 "uploaded": list(uploaded),
-            },
+            }
         )
 
+    def _compress(self, body: bytes) -> bytes:
+        if self._zstd is not None:
+            return self._zstd.compress(body)
+        return gzip.compress(body)
+
+    def _post(self, payload, **kwargs):
+        """Post a json payload to the file stream endpoint, compressed if configured."""
+        if self._compression is None:
+            kwargs["json"] = payload
+        else:
+            kwargs["data"] = self._compress(json.dumps(payload).encode("utf-8"))
+            kwargs["headers"] = {
+                "Content-Type": "application/json",
+                "Content-Encoding": self._compression,
+            }
+        start = time.monotonic()
+        response = request_with_retry(self._client.post, self._endpoint, **kwargs)
+        self._post_latency = time.monotonic() - start
+        self._post_count += 1
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns a snapshot of how far behind the file stream is.
+
+        Pending bytes are chunk bytes pushed but not yet posted, the queue depth
+        is the number of items the stream thread has not picked up yet.
+        """
+        return {
+            "queue_depth": self._queue.qsize(),
+            "pending_bytes": max(0, self._queued_bytes - self._sent_bytes),
+            "posts": self._post_count,
+            "post_latency": self._post_latency,
+        }
+
     def _thread_except_body(self):
         # TODO: Consolidate with internal_util.ExceptionThread
         try:
@@ -459,25 +515,21 @@ class FileStreamApi:
 
         for fs in file_stream_utils.split_files(files, max_bytes=util.MAX_LINE_BYTES):
             self._handle_response(
-                request_with_retry(
-                    self._client.post,
-                    self._endpoint,
-                    json={"files": fs, "dropped": self._dropped_chunks},
+                self._post(
+                    {"files": fs, "dropped": self._dropped_chunks},
                     retry_callback=self._api.retry_callback,
                 )
             )
 
         if uploaded:
             if isinstance(
-                request_with_retry(
-                    self._client.post,
-                    self._endpoint,
-                    json={
+                self._post(
+                    {
                         "complete": False,
                         "failed": False,
                         "dropped": self._dropped_chunks,
                         "uploaded": uploaded,
-                    },
+                    }
                 ),
                 Exception,
             ):
@@ -500,6 +552,7 @@ class FileStreamApi:
             chunk_id: TODO: change to 'offset'
             chunk: File data.
         """
+        self._queued_bytes += len(data)
         self._queue.put(Chunk(filename, data))
 
     def push_success(self, artifact_id, save_name) -> None:
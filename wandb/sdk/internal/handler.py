@@ -17,6 +17,7 @@ from typing import (
     List,
     Optional,
     Sequence,
+    Set,
     Tuple,
     TYPE_CHECKING,
 )
@@ -45,6 +46,10 @@ if TYPE_CHECKING:
 
 SummaryDict = Dict[str, Any]
 
+# minimum time between summary records sent while the run is live, changed
+# keys are accumulated and sent together
+SUMMARY_DEBOUNCE_SECONDS = 1.0
+
 logger = logging.getLogger(__name__)
 
 
@@ -63,8 +68,12 @@ def _dict_nested_set(target: Dict[str, Any], key_list: Sequence[str], v: Any) ->
 
 class HandleManager:
     _consolidated_summary: SummaryDict
+    _summary_dirty: Set[str]
+    _summary_removed: Set[str]
+    _summary_saved_time: float
     _sampled_history: Dict[str, sample.UniformSampleAccumulator]
     _partial_history: Dict[str, Any]
+    _partial_history_json: Dict[str, str]
     _settings: SettingsStatic
     _record_q: "Queue[Record]"
     _result_q: "Queue[Result]"
@@ -110,8 +119,13 @@ class HandleManager:
 
         # keep track of summary from key/val updates
         self._consolidated_summary = dict()
+        # top level summary keys changed or removed since the last summary record
+        self._summary_dirty = set()
+        self._summary_removed = set()
+        self._summary_saved_time = 0
         self._sampled_history = defaultdict(sample.UniformSampleAccumulator)
         self._partial_history = dict()
+        self._partial_history_json = dict()
         self._metric_defines = defaultdict(MetricRecord)
         self._metric_globs = defaultdict(MetricRecord)
         self._metric_track = dict()
@@ -154,7 +168,7 @@ class HandleManager:
         self._result_q.put(result)
 
     def debounce(self) -> None:
-        pass
+        self._maybe_save_summary()
 
     def handle_request_defer(self, record: Record) -> None:
         defer = record.request.defer
@@ -207,12 +221,46 @@ class HandleManager:
     def handle_alert(self, record: Record) -> None:
         self._dispatch_record(record)
 
+    def _mark_summary(self, key: str, removed: bool = False) -> None:
+        if removed:
+            self._summary_dirty.discard(key)
+            self._summary_removed.add(key)
+        else:
+            self._summary_removed.discard(key)
+            self._summary_dirty.add(key)
+
+    def _maybe_save_summary(self) -> None:
+        if not self._summary_dirty and not self._summary_removed:
+            return
+        if time.time() - self._summary_saved_time < SUMMARY_DEBOUNCE_SECONDS:
+            return
+        self._save_summary_delta()
+
+    def _save_summary_delta(self) -> None:
+        summary = SummaryRecord()
+        for k in self._summary_dirty:
+            if k not in self._consolidated_summary:
+                continue
+            update = summary.update.add()
+            update.key = k
+            update.value_json = json.dumps(self._consolidated_summary[k])
+        for k in self._summary_removed:
+            remove = summary.remove.add()
+            remove.key = k
+        self._send_summary(summary)
+
     def _save_summary(self, summary_dict: SummaryDict, flush: bool = False) -> None:
         summary = SummaryRecord()
         for k, v in summary_dict.items():
             update = summary.update.add()
             update.key = k
             update.value_json = json.dumps(v)
+        self._send_summary(summary, flush=flush)
+
+    def _send_summary(self, summary: SummaryRecord, flush: bool = False) -> None:
+        self._summary_dirty.clear()
+        self._summary_removed.clear()
+        self._summary_saved_time = time.time()
         record = Record(summary=summary)
         if flush:
             self._dispatch_record(record)
@@ -222,12 +270,10 @@ class HandleManager:
 
     def _save_history(
         self,
-        history: HistoryRecord,
+        history_dict: Dict[str, Any],
     ) -> None:
-        for item in history.item:
+        for k, v in history_dict.items():
             # TODO(jhr) save nested keys?
-            k = item.key
-            v = json.loads(item.value_json)
             if isinstance(v, numbers.Real):
                 self._sampled_history[k].add(v)
 
@@ -370,10 +416,13 @@ class HandleManager:
         if not self._metric_defines:
             history_dict = self._update_summary_media_objects(history_dict)
             self._consolidated_summary.update(history_dict)
+            for k in history_dict:
+                self._mark_summary(k)
             return True
         updated = False
         for k, v in history_dict.items():
             if self._update_summary_list(kl=[k], v=v):
+                self._mark_summary(k)
                 updated = True
         return updated
 
@@ -481,7 +530,11 @@ class HandleManager:
 
     def handle_history(self, record: Record) -> None:
         history_dict = proto_util.dict_from_proto_list(record.history.item)
+        self._handle_history(record, history_dict)
 
+    def _handle_history(self, record: Record, history_dict: Dict[str, Any]) -> None:
+        # history_dict holds the decoded values of record.history.item and is
+        # kept in sync with it, so each value is only decoded once
         # Inject _runtime if it is not present
         if history_dict is not None:
             if "_runtime" not in history_dict:
@@ -489,10 +542,10 @@ class HandleManager:
 
         self._history_update(record.history, history_dict)
         self._dispatch_record(record)
-        self._save_history(record.history)
+        self._save_history(history_dict)
         updated = self._update_summary(history_dict)
         if updated:
-            self._save_summary(self._consolidated_summary)
+            self._maybe_save_summary()
 
     def _flush_partial_history(
         self,
@@ -500,14 +553,15 @@ class HandleManager:
     ) -> None:
         if self._partial_history:
             history = HistoryRecord()
-            for k, v in self._partial_history.items():
+            for k, v in self._partial_history_json.items():
                 item = history.item.add()
                 item.key = k
-                item.value_json = json.dumps(v)
+                item.value_json = v
             if step is not None:
                 history.step.num = step
-            self.handle_history(Record(history=history))
+            self._handle_history(Record(history=history), self._partial_history)
             self._partial_history = {}
+            self._partial_history_json = {}
 
     def handle_request_partial_history(self, record: Record) -> None:
         partial_history = record.request.partial_history
@@ -534,6 +588,9 @@ class HandleManager:
             flush = True
 
         self._partial_history.update(history_dict)
+        self._partial_history_json.update(
+            (item.key, item.value_json) for item in partial_history.item
+        )
 
         if flush:
             self._flush_partial_history(self._step)
@@ -558,6 +615,7 @@ class HandleManager:
 
             # use the last element of the key to write the leaf:
             target[key[-1]] = json.loads(item.value_json)
+            self._mark_summary(key[0])
 
         for item in summary.remove:
             if len(item.nested_key) > 0:
@@ -577,8 +635,9 @@ class HandleManager:
 
             # use the last element of the key to erase the leaf:
             del target[key[-1]]
+            self._mark_summary(key[0], removed=len(key) == 1)
 
-        self._save_summary(self._consolidated_summary)
+        self._maybe_save_summary()
 
     def handle_exit(self, record: Record) -> None:
         if self._track_time is not None:
@@ -806,6 +865,8 @@ class HandleManager:
         logger.info("shutting down handler")
         if self._tb_watcher:
             self._tb_watcher.finish()
+        if self._summary_dirty or self._summary_removed:
+            self._save_summary_delta()
 
     def __next__(self) -> Record:
         return self._record_q.get(block=True)
@@ -205,6 +205,7 @@ class SendManager:
             silent=None,
             _live_policy_rate_limit=None,
             _live_policy_wait_time=None,
+            _file_stream_compression=None,
         )
         settings = SettingsStatic(sd)
         record_q: "Queue[Record]" = queue.Queue()
@@ -347,6 +348,13 @@ class SendManager:
                 break
             except Exception as e:
                 logger.warning(f"Error emptying retry queue: {e}")
+        if self._fs:
+            stats = self._fs.stats()
+            fs_stats = status_resp.file_stream_stats
+            fs_stats.queue_depth = stats["queue_depth"]
+            fs_stats.pending_bytes = stats["pending_bytes"]
+            fs_stats.posts = stats["posts"]
+            fs_stats.post_latency = stats["post_latency"]
         self._respond_result(result)
 
     def send_request_login(self, record: "Record") -> None:
@@ -784,6 +792,7 @@ class SendManager:
             self._run.run_id,
             self._run.start_time.ToSeconds(),
             settings=self._api_settings,
+            compression=self._settings._file_stream_compression,
         )
         # Ensure the streaming polices have the proper offsets
         self._fs.set_file_policy("wandb-summary.json", file_stream.SummaryFilePolicy())
@@ -818,18 +827,19 @@ class SendManager:
             self._run.start_time.ToSeconds(),
         )
 
-    def _save_history(self, history_dict: Dict[str, Any]) -> None:
-        if self._fs:
-            self._fs.push(filenames.HISTORY_FNAME, json.dumps(history_dict))
-
     def send_history(self, record: "Record") -> None:
-        history = record.history
-        history_dict = proto_util.dict_from_proto_list(history.item)
-        self._save_history(history_dict)
+        # values are already json encoded, so we don't need to decode them
+        # just to encode them again for the file stream
+        if self._fs:
+            history_json = proto_util.json_from_proto_list(record.history.item)
+            self._fs.push(filenames.HISTORY_FNAME, history_json)
 
     def send_summary(self, record: "Record") -> None:
+        # summary records only carry the keys that changed since the last one
         summary_dict = proto_util.dict_from_proto_list(record.summary.update)
-        self._cached_summary = summary_dict
+        self._cached_summary.update(summary_dict)
+        for item in record.summary.remove:
+            self._cached_summary.pop(item.key, None)
         self._update_summary()
 
     def _update_summary(self) -> None:
@@ -9,8 +9,12 @@ SettingsDict = Dict[str, Union[str, float, Tuple, None]]
 class SettingsStatic:
     # TODO(jhr): figure out how to share type defs with sdk/wandb_settings.py
     _offline: Optional[bool]
+    _datastore_group_commit: Optional[bool]
+    _datastore_commit_interval: Optional[float]
+    _datastore_commit_bytes: Optional[int]
     _disable_stats: Optional[bool]
     _disable_meta: Optional[bool]
+    _file_stream_compression: Optional[str]
     _start_time: float
     _start_datetime: str
     _stats_pid: int
@@ -21,7 +21,14 @@ class WriteManager:
         self._ds = None
 
     def open(self):
-        self._ds = datastore.DataStore()
+        if self._settings._datastore_group_commit:
+            self._ds = datastore.DataStore(
+                group_commit=True,
+                commit_interval=self._settings._datastore_commit_interval,
+                commit_bytes=self._settings._datastore_commit_bytes,
+            )
+        else:
+            self._ds = datastore.DataStore()
         self._ds.open_for_write(self._settings.sync_file)
 
     def write(self, record):
@@ -33,9 +40,20 @@ class WriteManager:
 
         self._ds.write(record)
 
+        # exit and final records mark points a resumed or synced run relies on
+        if record_type in ("exit", "final"):
+            self._ds.commit()
+
+    @property
+    def durable_offset(self):
+        if not self._ds:
+            return 0
+        return self._ds.durable_offset
+
     def finish(self):
         if self._ds:
             self._ds.close()
 
     def debounce(self) -> None:
-        pass
+        if self._ds:
+            self._ds.maybe_commit()
@@ -0,0 +1,93 @@
+import base64
+import hashlib
+import mmap
+import os
+from typing import Any, Dict, Iterable, Sequence
+
+# files are hashed through a reused buffer of this size, so hashing a file
+# never holds more than this much of it in memory at once
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_files(
+    paths: Iterable[str],
+    algorithms: Sequence[str] = ("md5",),
+    use_mmap: bool = False,
+    chunk_size: int = HASH_CHUNK_SIZE,
+) -> Dict[str, Any]:
+    """Hashes the contents of `paths`, in order, with each of `algorithms` in one pass.
+
+    Returns the hash objects keyed by algorithm name. With `use_mmap` the files
+    are mapped rather than read, which avoids copying them through the buffer.
+    """
+    hashers = {name: hashlib.new(name) for name in algorithms}
+    buf = None
+    view = None
+    for path in paths:
+        with open(path, "rb") as f:
+            if use_mmap and os.fstat(f.fileno()).st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    mm_view = memoryview(mm)
+                    try:
+                        for offset in range(0, len(mm), chunk_size):
+                            chunk = mm_view[offset : offset + chunk_size]
+                            for hasher in hashers.values():
+                                hasher.update(chunk)
+                            chunk.release()
+                    finally:
+                        mm_view.release()
+                continue
+            if buf is None:
+                buf = bytearray(chunk_size)
+                view = memoryview(buf)
+            assert view is not None
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                for hasher in hashers.values():
+                    hasher.update(view[:n])
+    return hashers
+
+
+def hash_file(
+    path: str,
+    algorithms: Sequence[str] = ("md5",),
+    use_mmap: bool = False,
+    chunk_size: int = HASH_CHUNK_SIZE,
+) -> Dict[str, Any]:
+    """Hashes a file with each of `algorithms` in one pass, see `hash_files`."""
+    return hash_files([path], algorithms, use_mmap=use_mmap, chunk_size=chunk_size)
+
+
+def b64_digest(hasher: Any) -> str:
+    return base64.b64encode(hasher.digest()).decode("ascii")
+
+
+def md5_file_b64(path: str, use_mmap: bool = False) -> str:
+    return b64_digest(hash_file(path, use_mmap=use_mmap)["md5"])
+
+
+def sha256_file_hex(path: str, use_mmap: bool = False) -> str:
+    return hash_file(path, ("sha256",), use_mmap=use_mmap)["sha256"].hexdigest()
+
+
+class HashingWriter:
+    """Wraps a binary file, hashing everything written to it.
+
+    Lets a file be hashed as it is produced instead of reading it back.
+    """
+
+    def __init__(self, f: Any, algorithms: Sequence[str] = ("md5",)) -> None:
+        self._f = f
+        self.hashers = {name: hashlib.new(name) for name in algorithms}
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        for hasher in self.hashers.values():
+            hasher.update(data)
+        self.size += len(data)
+        return self._f.write(data)
+
+    def flush(self) -> None:
+        self._f.flush()
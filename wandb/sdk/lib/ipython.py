@@ -21,6 +21,10 @@ def toggle_button(what="run"):
 
 
 def _get_python_type():
+    if "IPython" not in sys.modules:
+        # nothing can be running under IPython if it was never imported, and
+        # importing it just to find that out is slow
+        return "python"
     try:
         from IPython import get_ipython  # type: ignore
 
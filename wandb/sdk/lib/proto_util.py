@@ -19,6 +19,15 @@ def dict_from_proto_list(obj_list: "RepeatedCompositeFieldContainer") -> Dict[st
     return {item.key: json.loads(item.value_json) for item in obj_list}
 
 
+def json_from_proto_list(obj_list: "RepeatedCompositeFieldContainer") -> str:
+    """Returns the json object of a proto list without decoding its values.
+
+    The result is the same as `json.dumps(dict_from_proto_list(obj_list))`.
+    """
+    items = {item.key: item.value_json for item in obj_list}
+    return "{" + ", ".join(f"{json.dumps(k)}: {v}" for k, v in items.items()) + "}"
+
+
 def _result_from_record(record: "pb.Record") -> "pb.Result":
     result = pb.Result(uuid=record.uuid, control=record.control)
     return result
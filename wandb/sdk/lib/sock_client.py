@@ -1,6 +1,7 @@
 import socket
 import struct
-from typing import Any, Optional
+import threading
+from typing import Any, Iterable, Optional
 from typing import TYPE_CHECKING
 import uuid
 
@@ -20,22 +21,40 @@ class SockClientClosedError(Exception):
 
 class SockClient:
     _sock: socket.socket
-    _data: bytes
+    _buf: bytearray
+    _view: memoryview
+    _start: int
+    _end: int
     _sockid: str
+    _lock: threading.Lock
 
     # current header is magic byte "W" followed by 4 byte length of the message
     HEADLEN = 1 + 4
 
+    # initial size of the receive buffer, grown to fit the largest message
+    BUFSIZE = 64 * 1024
+
     def __init__(self) -> None:
-        self._data = b""
+        # received data lives in _buf[_start:_end], messages are parsed in place
+        self._buf = bytearray(self.BUFSIZE)
+        self._view = memoryview(self._buf)
+        self._start = 0
+        self._end = 0
         # TODO: use safe uuid's (python3.7+) or emulate this
         self._sockid = uuid.uuid4().hex
+        # messages can be sent from several threads, keep them from interleaving
+        self._lock = threading.Lock()
 
     def connect(self, port: int) -> None:
         s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         s.connect(("localhost", port))
         self._sock = s
 
+    def connect_unix(self, path: str) -> None:
+        s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        s.connect(path)
+        self._sock = s
+
     def close(self) -> None:
         self._sock.close()
 
@@ -51,7 +70,8 @@ class SockClient:
         data = msg.SerializeToString()
         assert len(data) == raw_size, "invalid serialization"
         header = struct.pack("<BI", ord("W"), raw_size)
-        self._sock.sendall(header + data)
+        with self._lock:
+            self._sock.sendall(header + data)
 
     def send_server_request(self, msg: Any) -> None:
         self._send_message(msg)
@@ -122,22 +142,47 @@ class SockClient:
         server_req.record_publish.CopyFrom(record)
         self.send_server_request(server_req)
 
+    def _reserve(self, size: int) -> None:
+        """Make room for `size` bytes of data starting at the first unread byte."""
+        if self._start + size <= len(self._buf):
+            return
+        pending = self._end - self._start
+        if size <= len(self._buf):
+            # move unread data to the front of the buffer
+            self._view[:pending] = self._view[self._start : self._end]
+        else:
+            buf = bytearray(max(size, 2 * len(self._buf)))
+            buf[:pending] = self._view[self._start : self._end]
+            self._view.release()
+            self._buf = buf
+            self._view = memoryview(buf)
+        self._start = 0
+        self._end = pending
+
+    def send_record_publish_batch(self, records: Iterable["pb.Record"]) -> None:
+        server_req = spb.ServerRequest()
+        server_req.record_publish_batch.record.extend(records)
+        self.send_server_request(server_req)
+
     def _extract_packet_bytes(self) -> Optional[bytes]:
         # Do we have enough data to read the header?
-        len_data = len(self._data)
-        start_offset = self.HEADLEN
-        if len_data >= start_offset:
-            header = self._data[:start_offset]
-            fields = struct.unpack("<BI", header)
-            magic, dlength = fields
-            assert magic == ord("W")
-            # Do we have enough data to read the full record?
-            end_offset = self.HEADLEN + dlength
-            if len_data >= end_offset:
-                rec_data = self._data[start_offset:end_offset]
-                self._data = self._data[end_offset:]
-                return rec_data
-        return None
+        len_data = self._end - self._start
+        if len_data < self.HEADLEN:
+            return None
+        magic, dlength = struct.unpack_from("<BI", self._buf, self._start)
+        assert magic == ord("W")
+        # Do we have enough data to read the full record?
+        if len_data < self.HEADLEN + dlength:
+            # make sure the rest of the record can be received in place
+            self._reserve(self.HEADLEN + dlength)
+            return None
+        start_offset = self._start + self.HEADLEN
+        end_offset = start_offset + dlength
+        rec_data = bytes(self._view[start_offset:end_offset])
+        self._start = end_offset
+        if self._start == self._end:
+            self._start = self._end = 0
+        return rec_data
 
     def _read_packet_bytes(self, timeout: int = None) -> Optional[bytes]:
         """Read full message from socket.
@@ -153,10 +198,12 @@ class SockClient:
             if rec:
                 return rec
 
+            if self._end == len(self._buf):
+                self._reserve(self._end - self._start + 1)
             if timeout:
                 self._sock.settimeout(timeout)
             try:
-                data = self._sock.recv(4096)
+                nbytes = self._sock.recv_into(self._view[self._end :])
             except socket.timeout:
                 break
             except ConnectionResetError:
@@ -166,11 +213,11 @@ class SockClient:
             finally:
                 if timeout:
                     self._sock.settimeout(None)
-            if len(data) == 0:
+            if nbytes == 0:
                 # socket.recv() will return 0 bytes if socket was shutdown
                 # caller will handle this condition like other connection problems
                 raise SockClientClosedError()
-            self._data += data
+            self._end += nbytes
         return None
 
     def read_server_request(self) -> Optional[spb.ServerRequest]:
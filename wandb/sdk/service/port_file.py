@@ -9,15 +9,20 @@ from typing import Optional
 class PortFile:
     _grpc_port: Optional[int]
     _sock_port: Optional[int]
+    _unix_path: Optional[str]
     _valid: bool
 
     GRPC_TOKEN = "grpc="
     SOCK_TOKEN = "sock="
+    UNIX_TOKEN = "unix="
     EOF_TOKEN = "EOF"
 
-    def __init__(self, grpc_port: int = None, sock_port: int = None) -> None:
+    def __init__(
+        self, grpc_port: int = None, sock_port: int = None, unix_path: str = None
+    ) -> None:
         self._grpc_port = grpc_port
         self._sock_port = sock_port
+        self._unix_path = unix_path
         self._valid = False
 
     def write(self, fname: str) -> None:
@@ -31,6 +36,8 @@ class PortFile:
                     data.append(f"{self.GRPC_TOKEN}{self._grpc_port}")
                 if self._sock_port:
                     data.append(f"{self.SOCK_TOKEN}{self._sock_port}")
+                if self._unix_path:
+                    data.append(f"{self.UNIX_TOKEN}{self._unix_path}")
                 data.append(self.EOF_TOKEN)
                 port_str = "\n".join(data)
                 written = f.write(port_str)
@@ -50,6 +57,8 @@ class PortFile:
                     self._grpc_port = int(ln[len(self.GRPC_TOKEN) :])
                 elif ln.startswith(self.SOCK_TOKEN):
                     self._sock_port = int(ln[len(self.SOCK_TOKEN) :])
+                elif ln.startswith(self.UNIX_TOKEN):
+                    self._unix_path = ln[len(self.UNIX_TOKEN) :].rstrip("\n")
             self._valid = True
 
     @property
@@ -60,6 +69,10 @@ class PortFile:
     def sock_port(self) -> Optional[int]:
         return self._sock_port
 
+    @property
+    def unix_path(self) -> Optional[str]:
+        return self._unix_path
+
     @property
     def is_valid(self) -> bool:
         return self._valid
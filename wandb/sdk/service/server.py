@@ -6,6 +6,7 @@ Start up grpc or socket transport servers.
 from concurrent import futures
 import logging
 import os
+import socket
 import sys
 from typing import Optional
 
@@ -24,7 +25,9 @@ class WandbServer:
     _debug: bool
     _serve_grpc: bool
     _serve_sock: bool
+    _serve_unix: bool
     _sock_server: Optional[SocketServer]
+    _unix_server: Optional[SocketServer]
 
     def __init__(
         self,
@@ -36,6 +39,7 @@ class WandbServer:
         debug: bool = True,
         serve_grpc: bool = False,
         serve_sock: bool = False,
+        serve_unix: bool = False,
     ) -> None:
         self._grpc_port = grpc_port
         self._sock_port = sock_port
@@ -45,7 +49,9 @@ class WandbServer:
         self._debug = debug
         self._serve_grpc = serve_grpc
         self._serve_sock = serve_sock
+        self._serve_unix = serve_unix
         self._sock_server = None
+        self._unix_server = None
 
         if grpc_port:
             _ = wandb.util.get_module(
@@ -57,11 +63,16 @@ class WandbServer:
             logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
 
     def _inform_used_ports(
-        self, grpc_port: Optional[int], sock_port: Optional[int]
+        self,
+        grpc_port: Optional[int],
+        sock_port: Optional[int],
+        unix_path: Optional[str] = None,
     ) -> None:
         if not self._port_fname:
             return
-        pf = port_file.PortFile(grpc_port=grpc_port, sock_port=sock_port)
+        pf = port_file.PortFile(
+            grpc_port=grpc_port, sock_port=sock_port, unix_path=unix_path
+        )
         pf.write(self._port_fname)
 
     def _start_grpc(self, mux: StreamMux) -> int:
@@ -109,9 +120,24 @@ class WandbServer:
             raise
         return port
 
+    def _start_unix(self, mux: StreamMux) -> Optional[str]:
+        # unix domain sockets are optional, clients fall back to the tcp socket
+        if not hasattr(socket, "AF_UNIX"):
+            return None
+        try:
+            self._unix_server = SocketServer(mux=mux, address="", port=0, unix=True)
+            self._unix_server.start()
+        except OSError as e:
+            logging.warning(f"Unable to serve unix domain socket: {e}")
+            self._unix_server = None
+            return None
+        return self._unix_server.path
+
     def _stop_servers(self) -> None:
         if self._sock_server:
             self._sock_server.stop()
+        if self._unix_server:
+            self._unix_server.stop()
 
     def _setup_tracelog(self) -> None:
         # TODO: remove this temporary hack, need to find a better way to pass settings
@@ -125,7 +151,12 @@ class WandbServer:
         mux = StreamMux()
         grpc_port = self._start_grpc(mux=mux) if self._serve_grpc else None
         sock_port = self._start_sock(mux=mux) if self._serve_sock else None
-        self._inform_used_ports(grpc_port=grpc_port, sock_port=sock_port)
+        unix_path = (
+            self._start_unix(mux=mux) if self._serve_sock and self._serve_unix else None
+        )
+        self._inform_used_ports(
+            grpc_port=grpc_port, sock_port=sock_port, unix_path=unix_path
+        )
         setproctitle = wandb.util.get_optional_module("setproctitle")
         if setproctitle:
             service_ver = 2
@@ -1,5 +1,8 @@
+import os
 import queue
+import shutil
 import socket
+import tempfile
 import threading
 import time
 from typing import Any, Callable, Dict, Optional
@@ -173,6 +176,13 @@ class SockServerReadThread(threading.Thread):
         assert iface.record_q
         iface.record_q.put(record)
 
+    def server_record_publish_batch(self, sreq: "spb.ServerRequest") -> None:
+        for record in sreq.record_publish_batch.record:
+            stream_id = record._info.stream_id
+            iface = self._mux.get_stream(stream_id).interface
+            assert iface.record_q
+            iface.record_q.put(record)
+
     def server_inform_finish(self, sreq: "spb.ServerRequest") -> None:
         request = sreq.inform_finish
         stream_id = request._info.stream_id
@@ -235,16 +245,28 @@ class SocketServer:
     _mux: StreamMux
     _address: str
     _port: int
+    _path: Optional[str]
     _sock: socket.socket
 
-    def __init__(self, mux: Any, address: str, port: int) -> None:
+    def __init__(self, mux: Any, address: str, port: int, unix: bool = False) -> None:
         self._mux = mux
         self._address = address
         self._port = port
+        self._path = None
         # This is the server socket that we accept new connections from
-        self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        if unix:
+            # the socket lives in a private directory, removed when stopped
+            self._path = os.path.join(
+                tempfile.mkdtemp(prefix="wandb-service-"), "socket"
+            )
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
 
     def _bind(self) -> None:
+        if self._path:
+            self._sock.bind(self._path)
+            return
         self._sock.bind((self._address, self._port))
         self._port = self._sock.getsockname()[1]
 
@@ -252,6 +274,10 @@ class SocketServer:
     def port(self) -> int:
         return self._port
 
+    @property
+    def path(self) -> Optional[str]:
+        return self._path
+
     def start(self) -> None:
         self._bind()
         self._thread = SockAcceptThread(sock=self._sock, mux=self._mux)
@@ -274,3 +300,5 @@ class SocketServer:
             except OSError:
                 pass
             self._sock.close()
+        if self._path:
+            shutil.rmtree(os.path.dirname(self._path), ignore_errors=True)
@@ -1,6 +1,7 @@
 """Reliably launch and connect to backend server process (wandb service).
 
-Backend server process can be connected to using tcp sockets or grpc transport.
+Backend server process can be connected to using tcp sockets, unix domain sockets
+or grpc transport.
 """
 
 import os
@@ -18,14 +19,17 @@ from .service_sock import ServiceSockInterface
 class _Service:
     _grpc_port: Optional[int]
     _sock_port: Optional[int]
+    _unix_path: Optional[str]
     _service_interface: ServiceInterface
     _internal_proc: Optional[subprocess.Popen]
 
-    def __init__(self, _use_grpc: bool = False) -> None:
+    def __init__(self, _use_grpc: bool = False, _use_unix: bool = False) -> None:
         self._use_grpc = _use_grpc
+        self._use_unix = _use_unix
         self._stub = None
         self._grpc_port = None
         self._sock_port = None
+        self._unix_path = None
         # current code only supports grpc or socket server implementation, in the
         # future we might be able to support both
         if _use_grpc:
@@ -53,6 +57,7 @@ class _Service:
                     continue
                 self._grpc_port = pf.grpc_port
                 self._sock_port = pf.sock_port
+                self._unix_path = pf.unix_path
             except Exception as e:
                 print("Error:", e)
                 return False
@@ -91,6 +96,8 @@ class _Service:
                 service_args.append("--serve-grpc")
             else:
                 service_args.append("--serve-sock")
+                if self._use_unix:
+                    service_args.append("--serve-unix")
             internal_proc = subprocess.Popen(
                 exec_cmd_list + service_args,
                 env=os.environ,
@@ -111,6 +118,10 @@ class _Service:
     def sock_port(self) -> Optional[int]:
         return self._sock_port
 
+    @property
+    def unix_path(self) -> Optional[str]:
+        return self._unix_path
+
     @property
     def service_interface(self) -> ServiceInterface:
         return self._service_interface
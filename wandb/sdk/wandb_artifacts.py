@@ -1,4 +1,5 @@
 import base64
+import concurrent.futures
 import contextlib
 import hashlib
 import os
@@ -67,6 +68,15 @@ _REQUEST_POOL_CONNECTIONS = 64
 
 _REQUEST_POOL_MAXSIZE = 64
 
+# Objects at least this large are downloaded as concurrent range requests
+DOWNLOAD_RANGE_THRESHOLD = 64 * 1024 * 1024
+
+_DOWNLOAD_RANGE_PART_SIZE = 16 * 1024 * 1024
+
+_DOWNLOAD_RANGE_WORKERS = 8
+
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 ARTIFACT_TMP = tempfile.TemporaryDirectory("wandb-artifacts")
 
 
@@ -376,12 +386,24 @@ class Artifact(ArtifactInterface):
         name: Optional[str] = None,
         is_tmp: Optional[bool] = False,
     ) -> ArtifactEntry:
+        return self._add_file(local_path, name=name, is_tmp=is_tmp)
+
+    def _add_file(
+        self,
+        local_path: str,
+        name: Optional[str] = None,
+        is_tmp: Optional[bool] = False,
+        digest: Optional[str] = None,
+    ) -> ArtifactEntry:
+        # digest can be passed in by callers that already hashed the file
         self._ensure_can_add()
         if not os.path.isfile(local_path):
             raise ValueError("Path is not a file: %s" % local_path)
 
         name = util.to_forward_slash_path(name or os.path.basename(local_path))
-        digest = md5_file_b64(local_path)
+        if digest is None:
+            digest = self._cache.file_md5_b64(local_path)
+            self._cache.flush()
 
         if is_tmp:
             file_path, file_name = os.path.split(name)
@@ -418,11 +440,14 @@ class Artifact(ArtifactInterface):
 
         import multiprocessing.dummy  # this uses threads
 
-        num_threads = 8
+        # hashing and copying are I/O bound and release the GIL, so use more
+        # threads than cores (the same default as ThreadPoolExecutor)
+        num_threads = min(32, (os.cpu_count() or 1) + 4)
         pool = multiprocessing.dummy.Pool(num_threads)
         pool.map(add_manifest_file, paths)
         pool.close()
         pool.join()
+        self._cache.flush()
 
         termlog("Done. %.1fs" % (time.time() - start_time), prefix=False)
 
@@ -695,8 +720,9 @@ class Artifact(ArtifactInterface):
     def _add_local_file(
         self, name: str, path: str, digest: Optional[str] = None
     ) -> ArtifactEntry:
-        digest = digest or md5_file_b64(path)
-        size = os.path.getsize(path)
+        stat = os.stat(path)
+        digest = digest or self._cache.file_md5_b64(path, stat)
+        size = stat.st_size
         name = util.to_forward_slash_path(name)
 
         cache_path, hit, cache_open = self._cache.check_md5_obj_path(digest, size)
@@ -901,18 +927,78 @@ class WandbStoragePolicy(StoragePolicy):
         if hit:
             return path
 
+        url = self._file_url(self._api, artifact.entity, manifest_entry)
+        size = manifest_entry.size or 0
+        headers = {}
+        if size >= DOWNLOAD_RANGE_THRESHOLD:
+            headers = {"Range": f"bytes=0-{_DOWNLOAD_RANGE_PART_SIZE - 1}"}
         response = self._session.get(
-            self._file_url(self._api, artifact.entity, manifest_entry),
+            url,
             auth=("api", self._api.api_key),
             stream=True,
+            headers=headers,
         )
         response.raise_for_status()
 
         with cache_open(mode="wb") as file:
-            for data in response.iter_content(chunk_size=16 * 1024):
-                file.write(data)
+            if response.status_code == 206:
+                # the server honors ranges, fetch the rest of the object concurrently
+                # and write each part straight into the preallocated cache file
+                file.truncate(size)
+                self._download_ranges(url, file.name, size, response)
+            else:
+                for data in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                    file.write(data)
         return path
 
+    def _download_ranges(
+        self, url: str, path: str, size: int, first: requests.Response
+    ) -> None:
+        starts = range(0, size, _DOWNLOAD_RANGE_PART_SIZE)
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=_DOWNLOAD_RANGE_WORKERS
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self._download_range,
+                    url,
+                    path,
+                    start,
+                    min(start + _DOWNLOAD_RANGE_PART_SIZE, size),
+                    first if start == 0 else None,
+                )
+                for start in starts
+            ]
+            for future in futures:
+                future.result()
+
+    def _download_range(
+        self,
+        url: str,
+        path: str,
+        start: int,
+        end: int,
+        response: Optional[requests.Response] = None,
+    ) -> None:
+        if response is None:
+            response = self._session.get(
+                url,
+                auth=("api", self._api.api_key),
+                stream=True,
+                headers={"Range": f"bytes={start}-{end - 1}"},
+            )
+            response.raise_for_status()
+        written = 0
+        with open(path, "r+b") as file:
+            file.seek(start)
+            for data in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                file.write(data)
+                written += len(data)
+        if response.status_code != 206 or written != end - start:
+            raise CommError(
+                "Incomplete download of bytes {}-{} from {}".format(start, end - 1, url)
+            )
+
     def store_reference(
         self,
         artifact: ArtifactInterface,
@@ -5,7 +5,7 @@ Create a grpc manager channel.
 
 import atexit
 import os
-from typing import Any, Callable, Dict, Optional, TYPE_CHECKING
+from typing import Any, Callable, cast, Dict, Optional, TYPE_CHECKING
 
 from wandb import env, trigger
 from wandb.sdk.lib.exit_hooks import ExitHooks
@@ -15,12 +15,13 @@ from wandb.sdk.lib.proto_util import settings_dict_from_pbmap
 if TYPE_CHECKING:
     from wandb.sdk.service import service
     from wandb.sdk.service.service_base import ServiceInterface
+    from wandb.sdk.service.service_sock import ServiceSockInterface
     from wandb.sdk.wandb_settings import Settings
 
 
 class _ManagerToken:
     _version = "2"
-    _supported_transports = {"grpc", "tcp"}
+    _supported_transports = {"grpc", "tcp", "unix"}
     _token_str: str
     _pid: int
     _transport: str
@@ -50,9 +51,11 @@ class _ManagerToken:
 
     def _parse(self) -> None:
         assert self._token_str
-        parts = self._token_str.split("-")
+        # host is a socket path for the unix transport and may contain dashes
+        parts = self._token_str.split("-", 3)
+        assert len(parts) == 4, f"invalid token: {self._token_str}"
+        parts[3:] = parts[3].rsplit("-", 1)
         assert len(parts) == 5, f"token must have 5 parts: {parts}"
-        # TODO: make more robust?
         version, pid_str, transport, host, port_str = parts
         assert version == self._version
         assert transport in self._supported_transports
@@ -91,7 +94,9 @@ class _Manager:
     _hooks: Optional[ExitHooks]
     _settings: "Settings"
 
-    def __init__(self, settings: "Settings", _use_grpc: bool = False) -> None:
+    def __init__(
+        self, settings: "Settings", _use_grpc: bool = False, _use_unix: bool = False
+    ) -> None:
         # TODO: warn if user doesnt have grpc installed
         from wandb.sdk.service import service
 
@@ -99,7 +104,7 @@ class _Manager:
         self._atexit_lambda = None
         self._hooks = None
 
-        self._service = service._Service(_use_grpc=_use_grpc)
+        self._service = service._Service(_use_grpc=_use_grpc, _use_unix=_use_unix)
 
         token = _ManagerToken.from_environment()
         if not token:
@@ -111,6 +116,10 @@ class _Manager:
             else:
                 transport = "tcp"
                 port = self._service.sock_port
+                # the service only reports a unix socket if it could serve one
+                if self._service.unix_path:
+                    transport = "unix"
+                    host = self._service.unix_path
             assert port
             token = _ManagerToken.from_params(transport=transport, host=host, port=port)
             token.set_environment()
@@ -120,7 +129,11 @@ class _Manager:
 
         port = self._token.port
         svc_iface = self._get_service_interface()
-        svc_iface._svc_connect(port=port)
+        if self._token.transport == "unix":
+            svc_iface_sock = cast("ServiceSockInterface", svc_iface)
+            svc_iface_sock._svc_connect_unix(path=self._token.host)
+        else:
+            svc_iface._svc_connect(port=port)
 
     def _atexit_setup(self) -> None:
         self._atexit_lambda = lambda: self._atexit_teardown()
@@ -1,6 +1,7 @@
 import _thread as thread
 import atexit
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from enum import IntEnum
 import functools
@@ -61,6 +62,7 @@ from . import wandb_artifacts
 from . import wandb_config
 from . import wandb_metric
 from . import wandb_summary
+from .data_types.utils import history_dict_has_pending_media
 from .interface.artifacts import Artifact as ArtifactInterface
 from .interface.interface import GlobStr, InterfaceBase
 from .interface.summary_record import SummaryRecord
@@ -105,6 +107,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("wandb")
 EXIT_TIMEOUT = 60
+# history rows queued behind media that is still being encoded
+MAX_PENDING_MEDIA_ROWS = 128
 RE_LABEL = re.compile(r"[a-zA-Z0-9_-]+$")
 
 
@@ -471,6 +475,12 @@ class Run:
         self._final_summary = None
         self._poll_exit_response = None
 
+        # History rows waiting on media encoded in the background, see `_async_media`
+        self._media_rows_pool: Optional[ThreadPoolExecutor] = None
+        self._media_rows = 0
+        self._media_rows_lock = threading.Lock()
+        self._media_rows_slots = threading.BoundedSemaphore(MAX_PENDING_MEDIA_ROWS)
+
         # Initialize telemetry object
         self._telemetry_obj = telemetry.TelemetryRecord()
         self._telemetry_obj_active = False
@@ -1220,13 +1230,48 @@ class Run:
         if self._backend and self._backend.interface:
             not_using_tensorboard = len(wandb.patched["tensorboard"]) == 0
 
-            self._backend.interface.publish_partial_history(
+            publish = functools.partial(
+                self._backend.interface.publish_partial_history,
                 row,
                 user_step=self._step,
                 step=step,
                 flush=commit,
                 publish_step=not_using_tensorboard,
             )
+            if self._settings._async_media and (
+                self._media_rows or history_dict_has_pending_media(row)
+            ):
+                self._publish_media_row(publish)
+            else:
+                publish()
+
+    def _publish_media_row(self, publish: Callable[[], None]) -> None:
+        # Rows are published in order by a single thread once their media is
+        # encoded, later rows queue up behind them even if they have no media.
+        def target() -> None:
+            try:
+                publish()
+            except Exception as e:
+                logger.exception("failed to publish history row")
+                wandb.termerror(f"Failed to log history row: {e}")
+            finally:
+                with self._media_rows_lock:
+                    self._media_rows -= 1
+                self._media_rows_slots.release()
+
+        self._media_rows_slots.acquire()
+        with self._media_rows_lock:
+            if self._media_rows_pool is None:
+                self._media_rows_pool = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="MediaHistoryRows"
+                )
+            self._media_rows += 1
+        self._media_rows_pool.submit(target)
+
+    def _flush_media_rows(self) -> None:
+        if self._media_rows_pool is not None:
+            self._media_rows_pool.shutdown(wait=True)
+            self._media_rows_pool = None
 
     def _console_callback(self, name: str, data: str) -> None:
         # logger.info("console callback: %s, %s", name, data)
@@ -1970,6 +2015,7 @@ class Run:
             self._run_status_checker.stop()
 
         self._console_stop()  # TODO: there's a race here with jupyter console logging
+        self._flush_media_rows()
 
         if self._backend and self._backend.interface:
             # telemetry could have changed, publish final data
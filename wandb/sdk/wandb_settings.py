@@ -1,6 +1,5 @@
 import configparser
 from datetime import datetime
-from distutils.util import strtobool
 import enum
 from functools import reduce
 import getpass
@@ -32,6 +31,7 @@ from urllib.parse import quote, urlencode, urlparse, urlsplit
 
 import wandb
 from wandb import util
+from wandb.env import strtobool
 from wandb.apis.internal import Api
 from wandb.errors import UsageError
 from wandb.sdk.wandb_config import Config
@@ -358,16 +358,21 @@ class Settings:
     # settings are declared as class attributes for static type checking purposes
     # and to help with IDE autocomplete.
     _args: Sequence[str]
+    _async_media: bool  # encode media on a background pool
     _cli_only_mode: bool  # Avoid running any code specific for runs
     _colab: bool
     _config_dict: Config
     _console: SettingsConsole
     _cuda: str
+    _datastore_commit_bytes: int
+    _datastore_commit_interval: float
+    _datastore_group_commit: bool
     _disable_meta: bool
     _disable_stats: bool
     _disable_viewer: bool  # Prevent early viewer query
     _except_exit: bool
     _executable: str
+    _file_stream_compression: str  # gzip or zstd, uncompressed if not set
     _internal_check_process: Union[int, float]
     _internal_queue_timeout: Union[int, float]
     _jupyter: bool
@@ -381,6 +386,9 @@ class Settings:
     _offline: bool
     _os: str
     _platform: str
+    _publish_batch: bool
+    _publish_batch_interval: float
+    _publish_batch_records: int
     _python: str
     _require_service: str
     _runqueue_item_id: str
@@ -485,9 +493,22 @@ class Settings:
         Note that key names must be the same as the class attribute names.
         """
         return dict(
+            _async_media={"value": False, "preprocessor": _str_as_bool},
+            _datastore_commit_bytes={
+                "value": 4 * 1024 * 1024,
+                "preprocessor": lambda x: int(x),
+            },
+            _datastore_commit_interval={
+                "value": 0.2,
+                "preprocessor": lambda x: float(x),
+            },
+            _datastore_group_commit={"value": False, "preprocessor": _str_as_bool},
             _disable_meta={"preprocessor": _str_as_bool},
             _disable_stats={"preprocessor": _str_as_bool},
             _disable_viewer={"preprocessor": _str_as_bool},
+            _file_stream_compression={
+                "validator": self._validate_file_stream_compression
+            },
             _colab={
                 "hook": lambda _: "google.colab" in sys.modules,
                 "auto_hook": True,
@@ -510,6 +531,12 @@ class Settings:
                 "auto_hook": True,
             },
             _platform={"value": util.get_platform_name()},
+            _publish_batch={"value": False, "preprocessor": _str_as_bool},
+            _publish_batch_interval={
+                "value": 0.005,
+                "preprocessor": lambda x: float(x),
+            },
+            _publish_batch_records={"value": 64, "preprocessor": lambda x: int(x)},
             _save_requirements={"value": True, "preprocessor": _str_as_bool},
             _stats_sample_rate_seconds={"value": 2.0},
             _stats_samples_to_average={"value": 15},
@@ -746,6 +773,15 @@ class Settings:
             raise UsageError(f"Settings field `console`: '{value}' not in {choices}")
         return True
 
+    @staticmethod
+    def _validate_file_stream_compression(value: str) -> bool:
+        choices: Set[str] = {"gzip", "zstd"}
+        if value not in choices:
+            raise UsageError(
+                f"Settings field `_file_stream_compression`: '{value}' not in {choices}"
+            )
+        return True
+
     @staticmethod
     def _validate_problem(value: str) -> bool:
         choices: Set[str] = {"fatal", "warn", "silent"}
@@ -270,8 +270,9 @@ class _WandbSetup__WandbSetup:  # noqa: N801
         # Temporary setting to allow use of grpc so that we can keep
         # that code from rotting during the transition
         use_grpc = self._settings._service_transport == "grpc"
+        use_unix = self._settings._service_transport == "unix"
         self._manager = wandb_manager._Manager(
-            _use_grpc=use_grpc, settings=self._settings
+            _use_grpc=use_grpc, _use_unix=use_unix, settings=self._settings
         )
 
     def _teardown_manager(self, exit_code: int) -> None:
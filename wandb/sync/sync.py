@@ -25,6 +25,8 @@ WANDB_SUFFIX = ".wandb"
 SYNCED_SUFFIX = ".synced"
 TFEVENT_SUBSTRING = ".tfevents."
 TMPDIR = tempfile.TemporaryDirectory()
+# how often a parallel sync logs its progress
+PROGRESS_INTERVAL_SECONDS = 30
 
 
 class _LocalRun:
@@ -40,6 +42,68 @@ class _LocalRun:
         return self.path
 
 
+class _SyncQueue:
+    """Thread safe iterable of sync items shared by the sync worker threads."""
+
+    def __init__(self, items):
+        self._queue = queue.Queue()
+        for item in items:
+            self._queue.put(item)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return self._queue.get_nowait()
+        except queue.Empty:
+            raise StopIteration
+
+
+class SyncStats:
+    """Counts runs and records synced across all sync worker threads."""
+
+    def __init__(self, total=0):
+        self._lock = threading.Lock()
+        self._start_time = time.time()
+        self.total = total
+        self.synced = 0
+        self.incomplete = 0
+        self.skipped = 0
+        self.failed = []
+        self.records = 0
+
+    def add(self, status, sync_item, records=0):
+        with self._lock:
+            self.records += records
+            if status == "synced":
+                self.synced += 1
+            elif status == "incomplete":
+                self.incomplete += 1
+            elif status == "skipped":
+                self.skipped += 1
+            else:
+                self.failed.append(sync_item)
+
+    @property
+    def done(self):
+        return self.synced + self.incomplete + self.skipped + len(self.failed)
+
+    def summary(self):
+        elapsed = max(time.time() - self._start_time, 1e-6)
+        return "{}/{} runs done ({} synced, {} incomplete, {} skipped, {} failed), {} records in {:.1f}s ({:.1f} records/s)".format(
+            self.done,
+            self.total,
+            self.synced,
+            self.incomplete,
+            self.skipped,
+            len(self.failed),
+            self.records,
+            elapsed,
+            self.records / elapsed,
+        )
+
+
 class SyncThread(threading.Thread):
     def __init__(
         self,
@@ -52,6 +116,8 @@ class SyncThread(threading.Thread):
         mark_synced=None,
         app_url=None,
         sync_tensorboard=None,
+        stats=None,
+        parallel=False,
     ):
         threading.Thread.__init__(self)
         # mark this process as internal
@@ -65,6 +131,9 @@ class SyncThread(threading.Thread):
         self._mark_synced = mark_synced
         self._app_url = app_url
         self._sync_tensorboard = sync_tensorboard
+        self._stats = stats or SyncStats(total=len(sync_list))
+        # when other workers are syncing too, print whole lines so output doesn't interleave
+        self._parallel = parallel
 
     def _parse_pb(self, data, exit_pb=None):
         pb = wandb_internal_pb2.Record()
@@ -196,12 +265,12 @@ class SyncThread(threading.Thread):
             wandb.termlog(print_line, newline=False, prefix=True)
             progress_step += 1
 
-        # finish sending any data
+        # send any pending summary and finish sending any data
+        handle_manager.finish()
         while len(send_manager) > 0:
             data = next(send_manager)
             send_manager.send(data)
         sys.stdout.flush()
-        handle_manager.finish()
         send_manager.finish()
 
     def _robust_scan(self, ds):
@@ -219,77 +288,98 @@ class SyncThread(threading.Thread):
             else:
                 raise e
 
-    def run(self):
-        for sync_item in self._sync_list:
-            tb_event_files, tb_logdirs, tb_root = self._find_tfevent_files(sync_item)
-            if os.path.isdir(sync_item):
-                files = os.listdir(sync_item)
-                filtered_files = list(filter(lambda f: f.endswith(WANDB_SUFFIX), files))
-                if tb_root is None and (
-                    check_and_warn_old(files) or len(filtered_files) != 1
-                ):
-                    print(f"Skipping directory: {sync_item}")
-                    continue
-                if len(filtered_files) > 0:
-                    sync_item = os.path.join(sync_item, filtered_files[0])
-            sync_tb = self._setup_tensorboard(
-                tb_root, tb_logdirs, tb_event_files, sync_item
-            )
-            # If we're syncing tensorboard, let's use a tmp dir for images etc.
-            root_dir = TMPDIR.name if sync_tb else os.path.dirname(sync_item)
-            sm = sender.SendManager.setup(root_dir)
-            if sync_tb:
-                self._send_tensorboard(tb_root, tb_logdirs, sm)
-                continue
-
-            ds = datastore.DataStore()
-            try:
-                ds.open_for_scan(sync_item)
-            except AssertionError as e:
-                print(f".wandb file is empty ({e}), skipping: {sync_item}")
+    def _sync_item(self, sync_item):
+        """Sync a single run, returns its status and the number of records sent."""
+        tb_event_files, tb_logdirs, tb_root = self._find_tfevent_files(sync_item)
+        if os.path.isdir(sync_item):
+            files = os.listdir(sync_item)
+            filtered_files = list(filter(lambda f: f.endswith(WANDB_SUFFIX), files))
+            if tb_root is None and (
+                check_and_warn_old(files) or len(filtered_files) != 1
+            ):
+                print(f"Skipping directory: {sync_item}")
+                return "skipped", 0
+            if len(filtered_files) > 0:
+                sync_item = os.path.join(sync_item, filtered_files[0])
+        sync_tb = self._setup_tensorboard(
+            tb_root, tb_logdirs, tb_event_files, sync_item
+        )
+        # If we're syncing tensorboard, let's use a tmp dir for images etc.
+        root_dir = TMPDIR.name if sync_tb else os.path.dirname(sync_item)
+        sm = sender.SendManager.setup(root_dir)
+        if sync_tb:
+            self._send_tensorboard(tb_root, tb_logdirs, sm)
+            return "synced", 0
+
+        ds = datastore.DataStore()
+        try:
+            ds.open_for_scan(sync_item, use_mmap=True)
+        except AssertionError as e:
+            print(f".wandb file is empty ({e}), skipping: {sync_item}")
+            return "skipped", 0
+
+        # save exit for final send
+        exit_pb = None
+        finished = False
+        shown = False
+        url = sync_item
+        records = 0
+        while True:
+            data = self._robust_scan(ds)
+            if data is None:
+                break
+            pb, exit_pb, cont = self._parse_pb(data, exit_pb)
+            if exit_pb is not None:
+                finished = True
+            if cont:
                 continue
-
-            # save exit for final send
-            exit_pb = None
-            finished = False
-            shown = False
-            while True:
-                data = self._robust_scan(ds)
-                if data is None:
-                    break
-                pb, exit_pb, cont = self._parse_pb(data, exit_pb)
-                if exit_pb is not None:
-                    finished = True
-                if cont:
-                    continue
-                sm.send(pb)
-                # send any records that were added in previous send
-                while not sm._record_q.empty():
-                    data = sm._record_q.get(block=True)
-                    sm.send(data)
-
-                if pb.control.req_resp:
-                    result = sm._result_q.get(block=True)
-                    result_type = result.WhichOneof("result_type")
-                    if not shown and result_type == "run_result":
-                        r = result.run_result.run
-                        # TODO(jhr): hardcode until we have settings in sync
-                        url = "{}/{}/{}/runs/{}".format(
-                            self._app_url,
-                            url_quote(r.entity),
-                            url_quote(r.project),
-                            url_quote(r.run_id),
-                        )
+            sm.send(pb)
+            records += 1
+            # send any records that were added in previous send
+            while not sm._record_q.empty():
+                data = sm._record_q.get(block=True)
+                sm.send(data)
+
+            if pb.control.req_resp:
+                result = sm._result_q.get(block=True)
+                result_type = result.WhichOneof("result_type")
+                if not shown and result_type == "run_result":
+                    r = result.run_result.run
+                    # TODO(jhr): hardcode until we have settings in sync
+                    url = "{}/{}/{}/runs/{}".format(
+                        self._app_url,
+                        url_quote(r.entity),
+                        url_quote(r.project),
+                        url_quote(r.run_id),
+                    )
+                    if self._parallel:
+                        print("Syncing: %s ..." % url)
+                    else:
                         print("Syncing: %s ..." % url, end="")
-                        sys.stdout.flush()
-                        shown = True
-            sm.finish()
-            # Only mark synced if the run actually finished
-            if self._mark_synced and not self._view and finished:
-                synced_file = f"{sync_item}{SYNCED_SUFFIX}"
-                with open(synced_file, "w"):
-                    pass
+                    sys.stdout.flush()
+                    shown = True
+        sm.finish()
+        # Only mark synced if the run actually finished
+        if self._mark_synced and not self._view and finished:
+            synced_file = f"{sync_item}{SYNCED_SUFFIX}"
+            with open(synced_file, "w"):
+                pass
+        if self._parallel:
+            print("Synced: %s" % url)
+        else:
             print("done.")
+        return ("synced" if finished else "incomplete"), records
+
+    def run(self):
+        for sync_item in self._sync_list:
+            try:
+                status, records = self._sync_item(sync_item)
+            except Exception as e:
+                # keep going so one bad run doesn't hold up the rest, the run is
+                # not marked synced so the next sync will retry it
+                wandb.termerror(f"Failed to sync {sync_item}: {e}")
+                status, records = "failed", 0
+            self._stats.add(status, sync_item, records)
 
 
 class SyncManager:
@@ -303,9 +393,12 @@ class SyncManager:
         view=None,
         verbose=None,
         sync_tensorboard=None,
+        jobs=1,
     ):
         self._sync_list = []
-        self._thread = None
+        self._threads = []
+        self._stats = None
+        self._last_progress = 0
         self._project = project
         self._entity = entity
         self._run_id = run_id
@@ -314,6 +407,11 @@ class SyncManager:
         self._view = view
         self._verbose = verbose
         self._sync_tensorboard = sync_tensorboard
+        self._jobs = max(1, jobs)
+
+    @property
+    def stats(self):
+        return self._stats
 
     def status(self):
         pass
@@ -322,25 +420,39 @@ class SyncManager:
         self._sync_list.append(os.path.abspath(str(p)))
 
     def start(self):
-        # create a thread for each file?
-        self._thread = SyncThread(
-            sync_list=self._sync_list,
-            project=self._project,
-            entity=self._entity,
-            run_id=self._run_id,
-            view=self._view,
-            verbose=self._verbose,
-            mark_synced=self._mark_synced,
-            app_url=self._app_url,
-            sync_tensorboard=self._sync_tensorboard,
-        )
-        self._thread.start()
+        self._stats = SyncStats(total=len(self._sync_list))
+        self._last_progress = time.time()
+        jobs = min(self._jobs, len(self._sync_list)) or 1
+        # workers pull runs from a shared queue, so each worker has at most
+        # one run (and its requests) in flight at a time
+        sync_list = self._sync_list if jobs == 1 else _SyncQueue(self._sync_list)
+        for _ in range(jobs):
+            thread = SyncThread(
+                sync_list=sync_list,
+                project=self._project,
+                entity=self._entity,
+                run_id=self._run_id,
+                view=self._view,
+                verbose=self._verbose,
+                mark_synced=self._mark_synced,
+                app_url=self._app_url,
+                sync_tensorboard=self._sync_tensorboard,
+                stats=self._stats,
+                parallel=jobs > 1,
+            )
+            thread.start()
+            self._threads.append(thread)
 
     def is_done(self):
-        return not self._thread.is_alive()
+        return not any(thread.is_alive() for thread in self._threads)
 
     def poll(self):
         time.sleep(1)
+        if self._jobs > 1 and self._stats:
+            now = time.time()
+            if now - self._last_progress > PROGRESS_INTERVAL_SECONDS:
+                self._last_progress = now
+                wandb.termlog(self._stats.summary())
         return False
 
 
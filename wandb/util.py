@@ -7,7 +7,6 @@ from datetime import date, datetime
 import errno
 import functools
 import gzip
-import hashlib
 import importlib
 from importlib import import_module
 import json
@@ -941,11 +940,9 @@ def has_num(dictionary: Mapping, key: Any) -> bool:
 
 
 def md5_file(path: str) -> str:
-    hash_md5 = hashlib.md5()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_md5.update(chunk)
-    return base64.b64encode(hash_md5.digest()).decode("ascii")
+    from wandb.sdk.lib import hashutil
+
+    return hashutil.md5_file_b64(path)
 
 
 def get_log_file_path() -> str: